@@ -0,0 +1,12 @@
+"""Logging handlers for config."""
+
+import os
+from logging.handlers import RotatingFileHandler
+
+
+class LazyDirRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that creates its log directory on first open."""
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
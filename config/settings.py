@@ -9,6 +9,11 @@ Optional Environment Variables:
 - DEBUG (default: False)
 - USE_POSTGRESQL (default: False)
 - ALLOWED_HOSTS (comma-separated)
+- SQL_LOG (default: False; log every SQL statement, requires DEBUG)
+- D0010_BULK_BATCH_SIZE (default: 5000; readings per bulk insert on import)
+- SAMPLE_DATA_DIR (default: BASE_DIR/sample_data; files for the testing dashboard)
+- REDIS_URL (default: redis://127.0.0.1:6379/1; shared cache when DEBUG is off)
+- CACHE_BACKEND / CACHE_LOCATION (override the cache; DEBUG defaults to locmem)
 
 NOTE: The meter_readings app is mounted at both root (/) and /meter_readings/
 for backward compatibility. This causes a URL namespace warning which is
@@ -21,27 +26,40 @@ from pathlib import Path
 # Build paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+env = os.environ
+_TRUE = {"true", "1", "yes", "on"}
+
+
+def _env_bool(key, default):
+    """Read a boolean flag from the environment with a single lookup."""
+    value = env.get(key)
+    return default if value is None else value.lower() in _TRUE
+
+
 # ==============================================================================
 # SECURITY SETTINGS
 # ==============================================================================
 
 # Secret key - MUST be set via environment in production
-SECRET_KEY = os.environ.get("SECRET_KEY")
+SECRET_KEY = env.get("SECRET_KEY")
 if not SECRET_KEY:
-    if os.environ.get("DJANGO_ENV") == "production":
+    if env.get("DJANGO_ENV") == "production":
         raise ValueError("SECRET_KEY must be set in production")
     # Development fallback
     SECRET_KEY = "dev-only-insecure-key-" + str(BASE_DIR)
 
 # Debug mode - defaults to True for development
-DEBUG = os.environ.get("DEBUG", "True").lower() == "true"
+DEBUG = _env_bool("DEBUG", True)
 
-# Allowed hosts
-ALLOWED_HOSTS = os.environ.get("ALLOWED_HOSTS", "localhost,127.0.0.1,0.0.0.0").split(
-    ","
-)
+# Allowed hosts (parsed once; blank entries dropped)
+_hosts = [
+    h.strip()
+    for h in env.get("ALLOWED_HOSTS", "localhost,127.0.0.1,0.0.0.0").split(",")
+    if h.strip()
+]
 if DEBUG:
-    ALLOWED_HOSTS.append("*")
+    _hosts.append("*")
+ALLOWED_HOSTS = tuple(_hosts)
 
 # Security headers
 SECURE_BROWSER_XSS_FILTER = True
@@ -60,6 +78,7 @@ if not DEBUG:
     SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
 # Session security
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = "Lax"
 SESSION_COOKIE_AGE = 86400  # 24 hours
@@ -80,6 +99,7 @@ INSTALLED_APPS = [
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
+    "whitenoise.runserver_nostatic",  # Must precede staticfiles
     "django.contrib.staticfiles",
     "django.contrib.humanize",  # Number formatting
     # Third-party apps
@@ -93,6 +113,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",  # Static files
     "corsheaders.middleware.CorsMiddleware",  # CORS support (must be early)
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -126,31 +147,53 @@ WSGI_APPLICATION = "config.wsgi.application"
 # DATABASE CONFIGURATION
 # ==============================================================================
 
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    },
-    "postgresql": {
-        "ENGINE": "django.db.backends.postgresql",
-        "NAME": os.environ.get("DB_NAME", "kraken_d0010"),
-        "USER": os.environ.get("DB_USER", "kraken_user"),
-        "PASSWORD": os.environ.get("DB_PASSWORD"),  # Required if USE_POSTGRESQL
-        "HOST": os.environ.get("DB_HOST", "localhost"),
-        "PORT": os.environ.get("DB_PORT", "5432"),
-        "CONN_MAX_AGE": 600,  # Connection pooling (10 minutes)
-        "OPTIONS": {"options": "-c default_transaction_isolation=read committed"},
-        "TEST": {
-            "NAME": "test_kraken_d0010",
+# Only the active backend is built; PostgreSQL is opted into via USE_POSTGRESQL
+if _env_bool("USE_POSTGRESQL", False):
+    db_password = env.get("DB_PASSWORD")
+    if not db_password:
+        raise ValueError("DB_PASSWORD must be set when USE_POSTGRESQL=true")
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.postgresql",
+            "NAME": env.get("DB_NAME", "kraken_d0010"),
+            "USER": env.get("DB_USER", "kraken_user"),
+            "PASSWORD": db_password,
+            "HOST": env.get("DB_HOST", "localhost"),
+            "PORT": env.get("DB_PORT", "5432"),
+            "CONN_MAX_AGE": 600,  # Connection pooling (10 minutes)
+            "OPTIONS": {"options": "-c default_transaction_isolation=read committed"},
+            "TEST": {
+                "NAME": "test_kraken_d0010",
+            },
         },
-    },
-}
+    }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / "db.sqlite3",
+        },
+    }
 
-# Switch to PostgreSQL if environment variable set
-if os.environ.get("USE_POSTGRESQL", "false").lower() == "true":
-    if not os.environ.get("DB_PASSWORD"):
-        raise ValueError("DB_PASSWORD must be set when USE_POSTGRESQL=true")
-    DATABASES["default"] = DATABASES["postgresql"].copy()
+# ==============================================================================
+# CACHE CONFIGURATION
+# ==============================================================================
+
+# Shared across workers in production so DRF throttle counters and cached
+# sessions are global; per-process locmem is fine for development.
+if DEBUG:
+    _cache_backend = "django.core.cache.backends.locmem.LocMemCache"
+    _cache_location = "kraken-default"
+else:
+    _cache_backend = "django.core.cache.backends.redis.RedisCache"
+    _cache_location = env.get("REDIS_URL", "redis://127.0.0.1:6379/1")
+
+CACHES = {
+    "default": {
+        "BACKEND": env.get("CACHE_BACKEND", _cache_backend),
+        "LOCATION": env.get("CACHE_LOCATION", _cache_location),
+    }
+}
 
 # ==============================================================================
 # PASSWORD VALIDATION
@@ -185,11 +228,15 @@ STATIC_URL = "/static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATICFILES_DIRS = [BASE_DIR / "static"] if (BASE_DIR / "static").exists() else []
 
-# Production static file handling
+# Production static file handling: hashed names plus gzip/brotli variants
+# generated once by collectstatic, served by WhiteNoise
 if not DEBUG:
-    STATICFILES_STORAGE = (
-        "django.contrib.staticfiles.storage.ManifestStaticFilesStorage"
-    )
+    STORAGES = {
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {
+            "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"
+        },
+    }
 
 # ==============================================================================
 # DEFAULT PRIMARY KEY FIELD TYPE
@@ -221,10 +268,14 @@ REST_FRAMEWORK = {
         "rest_framework.filters.SearchFilter",
         "rest_framework.filters.OrderingFilter",
     ],
-    # Response rendering
+    # Response rendering (browsable API added below in DEBUG only)
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
-        "rest_framework.renderers.BrowsableAPIRenderer",  # Dev only
+        "drf_orjson_renderer.renderers.ORJSONRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "drf_orjson_renderer.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",  # File uploads
     ],
     # Schema generation
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
@@ -239,6 +290,11 @@ REST_FRAMEWORK = {
     },
 }
 
+if DEBUG:
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+        "rest_framework.renderers.BrowsableAPIRenderer"
+    )
+
 # ==============================================================================
 # API DOCUMENTATION (Swagger/OpenAPI)
 # ==============================================================================
@@ -260,12 +316,16 @@ SPECTACULAR_SETTINGS = {
 if DEBUG:
     CORS_ALLOW_ALL_ORIGINS = True  # Development only
 else:
-    CORS_ALLOWED_ORIGINS = os.environ.get(
-        "CORS_ALLOWED_ORIGINS", "https://kraken.tech,https://app.kraken.tech"
-    ).split(",")
+    CORS_ALLOWED_ORIGINS = tuple(
+        origin.strip()
+        for origin in env.get(
+            "CORS_ALLOWED_ORIGINS", "https://kraken.tech,https://app.kraken.tech"
+        ).split(",")
+        if origin.strip()
+    )
 
 CORS_ALLOW_CREDENTIALS = True
-CORS_ALLOW_HEADERS = [
+CORS_ALLOW_HEADERS = (
     "accept",
     "accept-encoding",
     "authorization",
@@ -275,15 +335,24 @@ CORS_ALLOW_HEADERS = [
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
-]
+)
+
+# ==============================================================================
+# D0010 IMPORT
+# ==============================================================================
+
+# Readings parsed and written per round of bulk inserts
+D0010_BULK_BATCH_SIZE = int(env.get("D0010_BULK_BATCH_SIZE", "5000"))
+
+# Directory of .uff files offered by the admin testing dashboard
+SAMPLE_DATA_DIR = Path(env.get("SAMPLE_DATA_DIR", BASE_DIR / "sample_data"))
 
 # ==============================================================================
 # LOGGING CONFIGURATION
 # ==============================================================================
 
-# Ensure logs directory exists
+# Created lazily by the file handlers on first write
 LOGS_DIR = BASE_DIR / "logs"
-LOGS_DIR.mkdir(exist_ok=True)
 
 LOGGING = {
     "version": 1,
@@ -308,15 +377,17 @@ LOGGING = {
             "formatter": "verbose" if DEBUG else "simple",
         },
         "file": {
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "config.log_handlers.LazyDirRotatingFileHandler",
             "filename": LOGS_DIR / "django.log",
+            "delay": True,
             "maxBytes": 10 * 1024 * 1024,  # 10 MB
             "backupCount": 5,
             "formatter": "verbose",
         },
         "import_file": {
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "config.log_handlers.LazyDirRotatingFileHandler",
             "filename": LOGS_DIR / "imports.log",
+            "delay": True,
             "maxBytes": 50 * 1024 * 1024,  # 50 MB (imports can be verbose)
             "backupCount": 10,
             "formatter": "verbose",
@@ -328,9 +399,11 @@ LOGGING = {
             "level": "INFO",
             "propagate": False,
         },
+        # Per-query SQL logging is opt-in: formatting every statement
+        # dominates request time in development
         "django.db.backends": {
             "handlers": ["file"],
-            "level": "DEBUG" if DEBUG else "INFO",
+            "level": "DEBUG" if _env_bool("SQL_LOG", False) else "INFO",
             "propagate": False,
         },
         "meter_readings": {
@@ -6,3 +6,19 @@ from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 application = get_wsgi_application()
+
+
+def _warm_up() -> None:
+    """Do lazy first-request work at worker boot instead."""
+    from django.apps import apps
+    from django.urls import get_resolver
+
+    # Import the URLconf (admin, API viewsets) and build the resolver cache
+    get_resolver().url_patterns
+
+    # Resolve model field/relation caches
+    for model in apps.get_models():
+        model._meta.get_fields()
+
+
+_warm_up()
@@ -1,17 +1,34 @@
 """Django admin configuration for meter readings models."""
 
+from functools import lru_cache
+
 from django.contrib import admin
+from django.db.models import Count
 from django.urls import reverse
 from django.utils.html import format_html
 
 from .models import FlowFile, Meter, MeterPoint, Reading
 
 
+@lru_cache(maxsize=8)
+def _change_url_parts(viewname):
+    """Reverse an admin change URL once, split around the object id."""
+    prefix, suffix = reverse(viewname, args=[0]).rsplit("/0/", 1)
+    return prefix, suffix
+
+
+def _change_url(viewname, pk):
+    """Build an admin change URL without walking the resolver per row."""
+    prefix, suffix = _change_url_parts(viewname)
+    return f"{prefix}/{pk}/{suffix}"
+
+
 class MeterInline(admin.TabularInline):
     model = Meter
     extra = 0
     readonly_fields = ["created_at", "updated_at"]
     fields = ["serial_number", "meter_type", "created_at", "updated_at"]
+    ordering = ["serial_number"]
 
 
 class ReadingInline(admin.TabularInline):
@@ -49,15 +66,27 @@ class MeterPointAdmin(admin.ModelAdmin):
     inlines = [MeterInline]
     ordering = ["mpan"]
 
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _meter_count=Count("meters", distinct=True),
+                _reading_count=Count("meters__readings"),
+            )
+        )
+
     def meter_count(self, obj):
-        return obj.meters.count()
+        return obj._meter_count
 
     meter_count.short_description = "Meters"
+    meter_count.admin_order_field = "_meter_count"
 
     def reading_count(self, obj):
-        return sum(meter.readings.count() for meter in obj.meters.all())
+        return obj._reading_count
 
     reading_count.short_description = "Total Readings"
+    reading_count.admin_order_field = "_reading_count"
 
 
 @admin.register(Meter)
@@ -75,18 +104,20 @@ class MeterAdmin(admin.ModelAdmin):
     inlines = [ReadingInline]
     ordering = ["meter_point__mpan", "serial_number"]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_reading_count=Count("readings"))
+
     def mpan_link(self, obj):
-        url = reverse(
-            "admin:meter_readings_meterpoint_change", args=[obj.meter_point.pk]
-        )
+        url = _change_url("admin:meter_readings_meterpoint_change", obj.meter_point_id)
         return format_html('<a href="{}">{}</a>', url, obj.meter_point.mpan)
 
     mpan_link.short_description = "MPAN"
 
     def reading_count(self, obj):
-        return obj.readings.count()
+        return obj._reading_count
 
     reading_count.short_description = "Readings"
+    reading_count.admin_order_field = "_reading_count"
 
 
 @admin.register(Reading)
@@ -111,39 +142,33 @@ class ReadingAdmin(admin.ModelAdmin):
         "flow_file",
     ]
     search_fields = [
-        "meter__meter_point__mpan",  # Search by MPAN
-        "meter__serial_number",  # Search by meter serial number
+        "mpan",  # Search by MPAN
+        "meter_serial",  # Search by meter serial number
         "flow_file__filename",  # Search by filename
     ]
     readonly_fields = ["created_at"]
     ordering = ["-reading_date"]
     date_hierarchy = "reading_date"
-
-    def get_queryset(self, request):
-        return (
-            super()
-            .get_queryset(request)
-            .select_related("meter__meter_point", "flow_file")
-        )
+    list_select_related = ("meter", "flow_file")
 
     def mpan_display(self, obj):
-        url = reverse(
-            "admin:meter_readings_meterpoint_change", args=[obj.meter.meter_point.pk]
+        url = _change_url(
+            "admin:meter_readings_meterpoint_change", obj.meter.meter_point_id
         )
-        return format_html('<a href="{}">{}</a>', url, obj.meter.meter_point.mpan)
+        return format_html('<a href="{}">{}</a>', url, obj.mpan)
 
     mpan_display.short_description = "MPAN"
-    mpan_display.admin_order_field = "meter__meter_point__mpan"
+    mpan_display.admin_order_field = "mpan"
 
     def meter_serial_display(self, obj):
-        url = reverse("admin:meter_readings_meter_change", args=[obj.meter.pk])
-        return format_html('<a href="{}">{}</a>', url, obj.meter.serial_number)
+        url = _change_url("admin:meter_readings_meter_change", obj.meter_id)
+        return format_html('<a href="{}">{}</a>', url, obj.meter_serial)
 
     meter_serial_display.short_description = "Meter Serial"
-    meter_serial_display.admin_order_field = "meter__serial_number"
+    meter_serial_display.admin_order_field = "meter_serial"
 
     def flow_file_display(self, obj):
-        url = reverse("admin:meter_readings_flowfile_change", args=[obj.flow_file.pk])
+        url = _change_url("admin:meter_readings_flowfile_change", obj.flow_file_id)
         return format_html('<a href="{}">{}</a>', url, obj.flow_file.filename)
 
     flow_file_display.short_description = "Source File"
@@ -1,70 +1,100 @@
 """Custom admin views for testing and debugging."""
 
 import os
-from io import StringIO
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.admin.views.decorators import staff_member_required
-from django.core.management import call_command
-from django.db import transaction
+from django.core.cache import cache
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
 
+from .management.commands.import_d0010 import import_file
 from .models import FlowFile, Meter, MeterPoint, Reading
+from .utils import bump_readings_cache_version, clear_all_data, count_rows
+
+# Dashboard data is polled by staff and only changes on import/clear
+DASHBOARD_CACHE_TIMEOUT = 15
+DASHBOARD_STATS_KEY = "dashboard:stats"
+DASHBOARD_FILES_KEY = "dashboard:files"
+
+
+def _collect_sample_files(sample_data_dir: Path) -> List[Dict[str, Any]]:
+    """List .uff files in the sample directory with their import status."""
+    # DirEntry.stat() reuses the data from the directory scan where possible
+    try:
+        with os.scandir(sample_data_dir) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".uff") and e.is_file()),
+                key=lambda e: e.name,
+            )
+    except FileNotFoundError:
+        return []
+
+    imported = set(
+        FlowFile.objects.filter(filename__in=[e.name for e in entries]).values_list(
+            "filename", flat=True
+        )
+    )
+    return [
+        {
+            "name": entry.name,
+            "path": entry.path,
+            "size": entry.stat().st_size,
+            "imported": entry.name in imported,
+        }
+        for entry in entries
+    ]
+
+
+def _collect_stats() -> Dict[str, Any]:
+    """Gather table counts and the most recently imported files."""
+    flow_files, meter_points, meters, readings = count_rows(
+        FlowFile, MeterPoint, Meter, Reading
+    )
+    return {
+        "stats": {
+            "flow_files": flow_files,
+            "meter_points": meter_points,
+            "meters": meters,
+            "readings": readings,
+        },
+        "recent_files": list(FlowFile.objects.order_by("-imported_at")[:5]),
+    }
+
+
+def _invalidate_dashboard_cache() -> None:
+    cache.delete_many([DASHBOARD_STATS_KEY, DASHBOARD_FILES_KEY])
 
 
 @staff_member_required
 def testing_dashboard(request: HttpRequest) -> HttpResponse:
     """Testing and debugging dashboard."""
-
-    # Get sample data directory
-    base_dir: Path = Path(__file__).resolve().parent.parent
-    sample_data_dir: Path = base_dir / "sample_data"
-
-    # Get list of .uff files
-    sample_files: List[Dict[str, Any]] = []
-    if sample_data_dir.exists():
-        for file in sorted(sample_data_dir.glob("*.uff")):
-            sample_files.append(
-                {
-                    "name": file.name,
-                    "path": str(file),
-                    "size": file.stat().st_size,
-                    "imported": FlowFile.objects.filter(filename=file.name).exists(),
-                }
-            )
+    sample_data_dir = Path(settings.SAMPLE_DATA_DIR)
 
     # Handle POST actions
     if request.method == "POST":
         action: Optional[str] = request.POST.get("action")
 
         if action == "clear_all":
-            with transaction.atomic():
-                reading_count = Reading.objects.count()
-                meter_count = Meter.objects.count()
-                mp_count = MeterPoint.objects.count()
-                file_count = FlowFile.objects.count()
-
-                Reading.objects.all().delete()
-                Meter.objects.all().delete()
-                MeterPoint.objects.all().delete()
-                FlowFile.objects.all().delete()
-
-                messages.success(
-                    request,
-                    f"✓ Cleared {reading_count} readings, {meter_count} meters, "
-                    f"{mp_count} meter points, {file_count} flow files",
-                )
+            counts = clear_all_data()
+            messages.success(
+                request,
+                f"✓ Cleared {counts['readings']} readings, {counts['meters']} "
+                f"meters, {counts['meter_points']} meter points, "
+                f"{counts['flow_files']} flow files",
+            )
+            _invalidate_dashboard_cache()
+            bump_readings_cache_version()
             return redirect("testing_dashboard")
 
         elif action == "import_file":
             file_path = request.POST.get("file_path")
             if file_path and os.path.exists(file_path):
                 try:
-                    output = StringIO()
-                    call_command("import_d0010", file_path, stdout=output)
+                    import_file(file_path)
                     messages.success(
                         request, f"✓ Imported {os.path.basename(file_path)}"
                     )
@@ -73,6 +103,7 @@ def testing_dashboard(request: HttpRequest) -> HttpResponse:
                         request,
                         f"✗ Error importing {os.path.basename(file_path)}: {str(e)}",
                     )
+            _invalidate_dashboard_cache()
             return redirect("testing_dashboard")
 
         elif action == "import_all":
@@ -80,16 +111,18 @@ def testing_dashboard(request: HttpRequest) -> HttpResponse:
             skipped = 0
             errors = 0
 
-            for file_info in sample_files:
+            # Scan afresh rather than trust the cached list, which may be
+            # stale; import_file makes each file atomic on its own
+            for file_info in _collect_sample_files(sample_data_dir):
                 if not file_info["imported"]:
                     try:
-                        output = StringIO()
-                        call_command("import_d0010", file_info["path"], stdout=output)
+                        import_file(file_info["path"])
                         imported += 1
                     except Exception as e:
                         errors += 1
                         messages.warning(
-                            request, f'✗ Error importing {file_info["name"]}: {str(e)}'
+                            request,
+                            f'✗ Error importing {file_info["name"]}: {str(e)}',
                         )
                 else:
                     skipped += 1
@@ -101,19 +134,20 @@ def testing_dashboard(request: HttpRequest) -> HttpResponse:
             if errors > 0:
                 messages.error(request, f"✗ {errors} files failed to import")
 
+            _invalidate_dashboard_cache()
             return redirect("testing_dashboard")
 
-    # Get current data statistics
+    # Get list of .uff files and current data statistics
     context: Dict[str, Any] = {
         "title": "Testing & Debug Dashboard",
-        "sample_files": sample_files,
-        "stats": {
-            "flow_files": FlowFile.objects.count(),
-            "meter_points": MeterPoint.objects.count(),
-            "meters": Meter.objects.count(),
-            "readings": Reading.objects.count(),
-        },
-        "recent_files": FlowFile.objects.order_by("-imported_at")[:5],
+        "sample_files": cache.get_or_set(
+            DASHBOARD_FILES_KEY,
+            lambda: _collect_sample_files(sample_data_dir),
+            DASHBOARD_CACHE_TIMEOUT,
+        ),
+        **cache.get_or_set(
+            DASHBOARD_STATS_KEY, _collect_stats, DASHBOARD_CACHE_TIMEOUT
+        ),
     }
 
     return render(request, "admin/testing_dashboard.html", context)
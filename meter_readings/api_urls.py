@@ -2,16 +2,35 @@
 API URL routing for meter readings.
 """
 
+from importlib import import_module
+
 from django.urls import include, path
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
 from rest_framework.routers import DefaultRouter
 
 from .api_views import FlowFileViewSet, MeterPointViewSet, MeterViewSet, ReadingViewSet
 
+
+def _lazy_view(dotted_path, **initkwargs):
+    """
+    Defer importing a class-based view until its URL is first requested.
+
+    The schema/docs views pull in drf_spectacular's rendering stack, which
+    is only needed when someone actually hits those endpoints.
+    """
+    resolved = None
+
+    def view(request, *args, **kwargs):
+        nonlocal resolved
+        if resolved is None:
+            module_path, class_name = dotted_path.rsplit(".", 1)
+            view_class = getattr(import_module(module_path), class_name)
+            resolved = view_class.as_view(**initkwargs)
+        return resolved(request, *args, **kwargs)
+
+    view.csrf_exempt = True
+    return view
+
+
 # Create router and register viewsets
 router = DefaultRouter()
 router.register(r"flow-files", FlowFileViewSet, basename="flowfile")
@@ -23,7 +42,19 @@ urlpatterns = [
     # API endpoints
     path("", include(router.urls)),
     # API documentation
-    path("schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
-    path("redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
+    path(
+        "schema/",
+        _lazy_view("drf_spectacular.views.SpectacularAPIView"),
+        name="schema",
+    ),
+    path(
+        "docs/",
+        _lazy_view("drf_spectacular.views.SpectacularSwaggerView", url_name="schema"),
+        name="swagger-ui",
+    ),
+    path(
+        "redoc/",
+        _lazy_view("drf_spectacular.views.SpectacularRedocView", url_name="schema"),
+        name="redoc",
+    ),
 ]
@@ -4,11 +4,24 @@ Provides REST endpoints for querying meter data.
 """
 
 import os
+import shutil
 import tempfile
-from typing import Any, Dict, Optional, Type
-
-from django.core.management import call_command
-from django.db.models import Count, Max, Min, QuerySet
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+
+from django.db.models import (
+    Count,
+    IntegerField,
+    Max,
+    Min,
+    OuterRef,
+    Prefetch,
+    QuerySet,
+    Subquery,
+)
+from django.db.models.functions import Coalesce
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema
 from rest_framework import filters, status, viewsets
@@ -17,7 +30,9 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 
+from .management.commands.import_d0010 import import_file
 from .models import FlowFile, Meter, MeterPoint, Reading
+from .pagination import ReadingCursorPagination
 from .serializers import (
     FlowFileSerializer,
     FlowFileUploadSerializer,
@@ -28,6 +43,24 @@ from .serializers import (
     ReadingSerializer,
     ReadingSummarySerializer,
 )
+from .utils import get_readings_cache_version
+
+# Reading list responses only change on import, so cache them briefly
+READINGS_CACHE_TIMEOUT = 60
+
+# Columns rendered by ReadingSerializer, across the select_related joins
+READING_LIST_FIELDS = (
+    "id",
+    "register_id",
+    "reading_date",
+    "reading_value",
+    "reading_type",
+    "created_at",
+    "mpan",
+    "meter_serial",
+    "meter__meter_type",
+    "flow_file__filename",
+)
 
 
 class FlowFileViewSet(viewsets.ReadOnlyModelViewSet):
@@ -93,32 +126,19 @@ class FlowFileViewSet(viewsets.ReadOnlyModelViewSet):
         temp_dir = tempfile.gettempdir()
         tmp_file_path = os.path.join(temp_dir, uploaded_file.name)
 
-        with open(tmp_file_path, "wb") as tmp_file:
-            for chunk in uploaded_file.chunks():
-                tmp_file.write(chunk)
+        if hasattr(uploaded_file, "temporary_file_path"):
+            # Large uploads are already on disk: move instead of copying
+            shutil.move(uploaded_file.temporary_file_path(), tmp_file_path)
+        else:
+            with open(tmp_file_path, "wb") as tmp_file:
+                shutil.copyfileobj(uploaded_file, tmp_file, 1024 * 1024)
 
         try:
-            # Call the import command
-            call_command("import_d0010", tmp_file_path)
-
-            # Get the imported flow file (most recent with this filename)
-            flow_file = (
-                FlowFile.objects.filter(filename=uploaded_file.name)
-                .order_by("-imported_at")
-                .first()
+            flow_file = import_file(tmp_file_path)
+            return Response(
+                FlowFileSerializer(flow_file).data,
+                status=status.HTTP_201_CREATED,
             )
-
-            if flow_file:
-                return Response(
-                    FlowFileSerializer(flow_file).data,
-                    status=status.HTTP_201_CREATED,
-                )
-            else:
-                return Response(
-                    {"error": "File imported but not found in database"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
         except Exception as e:
             return Response(
                 {"error": f"Import failed: {str(e)}"},
@@ -126,8 +146,7 @@ class FlowFileViewSet(viewsets.ReadOnlyModelViewSet):
             )
         finally:
             # Clean up temporary file
-            if os.path.exists(tmp_file_path):
-                os.unlink(tmp_file_path)
+            Path(tmp_file_path).unlink(missing_ok=True)
 
 
 class MeterPointViewSet(viewsets.ReadOnlyModelViewSet):
@@ -143,9 +162,31 @@ class MeterPointViewSet(viewsets.ReadOnlyModelViewSet):
     - `/api/v1/meter-points/{id}/readings/` - Get all readings for a meter point
     """
 
+    # Correlated subqueries count each relation independently instead of
+    # joining meters and readings and de-duplicating the cross product
     queryset = MeterPoint.objects.annotate(
-        meter_count=Count("meters", distinct=True),
-        reading_count=Count("meters__readings", distinct=True),
+        meter_count=Coalesce(
+            Subquery(
+                Meter.objects.filter(meter_point=OuterRef("pk"))
+                .order_by()
+                .values("meter_point")
+                .annotate(c=Count("id"))
+                .values("c"),
+                output_field=IntegerField(),
+            ),
+            0,
+        ),
+        reading_count=Coalesce(
+            Subquery(
+                Reading.objects.filter(meter__meter_point=OuterRef("pk"))
+                .order_by()
+                .values("meter__meter_point")
+                .annotate(c=Count("id"))
+                .values("c"),
+                output_field=IntegerField(),
+            ),
+            0,
+        ),
     ).order_by("mpan")
 
     filter_backends = [
@@ -163,6 +204,15 @@ class MeterPointViewSet(viewsets.ReadOnlyModelViewSet):
             return MeterPointDetailSerializer
         return MeterPointSerializer
 
+    def get_queryset(self) -> QuerySet[MeterPoint]:
+        """Prefetch the nested meters, in order, for the detail view."""
+        queryset: QuerySet[MeterPoint] = super().get_queryset()
+        if self.action == "retrieve":
+            queryset = queryset.prefetch_related(
+                Prefetch("meters", queryset=Meter.objects.order_by("serial_number"))
+            )
+        return queryset
+
     @extend_schema(
         summary="List all meter points (MPANs)",
         description=(
@@ -189,14 +239,20 @@ class MeterPointViewSet(viewsets.ReadOnlyModelViewSet):
     )
     @action(detail=True, methods=["get"])
     def readings(self, request: Request, pk: Optional[int] = None) -> Response:
-        """Get all readings for this meter point."""
+        """Get paginated readings for this meter point."""
         meter_point: MeterPoint = self.get_object()
         readings: QuerySet[Reading] = (
             Reading.objects.filter(meter__meter_point=meter_point)
-            .select_related("meter__meter_point", "flow_file")
+            .select_related("meter", "flow_file")
+            .only(*READING_LIST_FIELDS)
             .order_by("-reading_date")
         )
 
+        page = self.paginate_queryset(readings)
+        if page is not None:
+            serializer = ReadingSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = ReadingSerializer(readings, many=True)
         return Response(serializer.data)
 
@@ -257,14 +313,20 @@ class MeterViewSet(viewsets.ReadOnlyModelViewSet):
     )
     @action(detail=True, methods=["get"])
     def readings(self, request: Request, pk: Optional[int] = None) -> Response:
-        """Get all readings for this meter."""
+        """Get paginated readings for this meter."""
         meter: Meter = self.get_object()
         readings: QuerySet[Reading] = (
             Reading.objects.filter(meter=meter)
-            .select_related("flow_file")
+            .select_related("meter", "flow_file")
+            .only(*READING_LIST_FIELDS)
             .order_by("-reading_date")
         )
 
+        page = self.paginate_queryset(readings)
+        if page is not None:
+            serializer = ReadingSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
         serializer = ReadingSerializer(readings, many=True)
         return Response(serializer.data)
 
@@ -274,7 +336,7 @@ class ReadingViewSet(viewsets.ReadOnlyModelViewSet):
     API endpoint for viewing meter readings.
 
     Retrieve:
-    - List all readings (paginated)
+    - List all readings (cursor paginated)
     - Get details for a specific reading
     - Filter by MPAN, date range, reading type, meter type
     - Search by MPAN or meter serial
@@ -293,23 +355,20 @@ class ReadingViewSet(viewsets.ReadOnlyModelViewSet):
     - `/api/v1/readings/summary/` - Get summary statistics
     """
 
-    queryset = Reading.objects.select_related(
-        "meter__meter_point", "meter", "flow_file"
-    ).order_by("-reading_date")
+    queryset = Reading.objects.select_related("meter", "flow_file").order_by(
+        "-reading_date", "-id"
+    )
 
+    pagination_class = ReadingCursorPagination
     filter_backends = [
         DjangoFilterBackend,
         filters.SearchFilter,
         filters.OrderingFilter,
     ]
     filterset_fields = ["reading_type", "register_id", "meter__meter_type"]
-    search_fields = [
-        "meter__meter_point__mpan",
-        "meter__serial_number",
-        "flow_file__filename",
-    ]
+    search_fields = ["mpan", "meter_serial", "flow_file__filename"]
     ordering_fields = ["reading_date", "reading_value", "created_at"]
-    ordering = ["-reading_date"]
+    ordering = ["-reading_date", "-id"]
 
     def get_serializer_class(self) -> Type[Serializer]:
         """Use detailed serializer for retrieve action."""
@@ -320,12 +379,20 @@ class ReadingViewSet(viewsets.ReadOnlyModelViewSet):
     @extend_schema(
         summary="List all meter readings",
         description=(
-            "Retrieve a paginated list of all meter readings. Supports "
+            "Retrieve a cursor-paginated list of all meter readings. Supports "
             "filtering by MPAN, date range, reading type, and meter type."
         ),
     )
     def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        return super().list(request, *args, **kwargs)
+        # The key prefix carries a version bumped on every import, so stale
+        # pages are never served after the data changes. Varying on Cookie
+        # keeps one session's browsable API page (username, CSRF token) from
+        # being served to another.
+        view = cache_page(
+            READINGS_CACHE_TIMEOUT,
+            key_prefix=f"readings:{get_readings_cache_version()}",
+        )(vary_on_headers("Accept", "Authorization", "Cookie")(super().list))
+        return view(request, *args, **kwargs)
 
     @extend_schema(
         summary="Get details for a specific reading",
@@ -341,15 +408,22 @@ class ReadingViewSet(viewsets.ReadOnlyModelViewSet):
         """Filter queryset by query parameters."""
         queryset: QuerySet[Reading] = super().get_queryset()
 
+        if self.action == "list":
+            # Load only the columns ReadingSerializer renders
+            queryset = queryset.only(*READING_LIST_FIELDS)
+        elif self.action == "retrieve":
+            # The nested meter renders its MPAN
+            queryset = queryset.select_related("meter__meter_point")
+
         # Filter by MPAN
         mpan: Optional[str] = self.request.query_params.get("mpan")
         if mpan:
-            queryset = queryset.filter(meter__meter_point__mpan=mpan)
+            queryset = queryset.filter(mpan=mpan)
 
         # Filter by meter serial
         meter_serial: Optional[str] = self.request.query_params.get("meter_serial")
         if meter_serial:
-            queryset = queryset.filter(meter__serial_number=meter_serial)
+            queryset = queryset.filter(meter_serial=meter_serial)
 
         # Filter by date range
         date_from: Optional[str] = self.request.query_params.get("date_from")
@@ -373,32 +447,38 @@ class ReadingViewSet(viewsets.ReadOnlyModelViewSet):
 
         Returns total counts, date range, and breakdown by reading type.
         """
-        readings: QuerySet[Reading] = self.get_queryset()
-
-        # Aggregate statistics
-        stats: Dict[str, Any] = readings.aggregate(
-            total_readings=Count("id"),
-            total_meter_points=Count("meter__meter_point", distinct=True),
-            total_meters=Count("meter", distinct=True),
-            earliest_reading=Min("reading_date"),
-            latest_reading=Max("reading_date"),
+        # Clear ordering so it does not leak into GROUP BY
+        readings: QuerySet[Reading] = self.get_queryset().order_by()
+
+        # One grouped scan gives per-type counts and the date range; totals
+        # are derived from the groups
+        rows: List[Dict[str, Any]] = list(
+            readings.values("reading_type").annotate(
+                count=Count("id"),
+                earliest=Min("reading_date"),
+                latest=Max("reading_date"),
+            )
         )
 
-        # Count by reading type
-        reading_types: Dict[str, int] = {}
-        type_counts = readings.values("reading_type").annotate(count=Count("id"))
-        for item in type_counts:
-            reading_types[item["reading_type"]] = item["count"]
+        # Distinct meter counts cannot be summed across groups
+        distinct: Dict[str, int] = (
+            readings.aggregate(
+                total_meter_points=Count("meter__meter_point", distinct=True),
+                total_meters=Count("meter", distinct=True),
+            )
+            if rows
+            else {"total_meter_points": 0, "total_meters": 0}
+        )
 
         summary: Dict[str, Any] = {
-            "total_readings": stats["total_readings"],
-            "total_meter_points": stats["total_meter_points"],
-            "total_meters": stats["total_meters"],
+            "total_readings": sum(row["count"] for row in rows),
+            "total_meter_points": distinct["total_meter_points"],
+            "total_meters": distinct["total_meters"],
             "date_range": {
-                "earliest": stats["earliest_reading"],
-                "latest": stats["latest_reading"],
+                "earliest": min((row["earliest"] for row in rows), default=None),
+                "latest": max((row["latest"] for row in rows), default=None),
             },
-            "reading_types": reading_types,
+            "reading_types": {row["reading_type"]: row["count"] for row in rows},
         }
 
         serializer = ReadingSummarySerializer(summary)
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("meter_readings", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reading",
+            index=models.Index(
+                fields=["-reading_date", "-id"], name="idx_reading_date_id_desc"
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 20:54
+
+import meter_readings.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("meter_readings", "0002_reading_date_id_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="meterpoint",
+            name="mpan",
+            field=models.CharField(
+                help_text="Meter Point Administration Number (13 digits)",
+                max_length=13,
+                unique=True,
+                validators=[meter_readings.models.validate_mpan],
+            ),
+        ),
+    ]
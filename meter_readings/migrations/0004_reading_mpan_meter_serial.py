@@ -0,0 +1,45 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill(apps, schema_editor):
+    Reading = apps.get_model("meter_readings", "Reading")
+    Meter = apps.get_model("meter_readings", "Meter")
+    meter = Meter.objects.filter(pk=OuterRef("meter_id"))
+    Reading.objects.update(
+        mpan=Subquery(meter.values("meter_point__mpan")[:1]),
+        meter_serial=Subquery(meter.values("serial_number")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("meter_readings", "0003_mpan_function_validator"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reading",
+            name="mpan",
+            field=models.CharField(
+                db_index=True, default="", editable=False, max_length=13
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="reading",
+            name="meter_serial",
+            field=models.CharField(default="", editable=False, max_length=20),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+        migrations.AlterModelOptions(
+            name="reading",
+            options={
+                "ordering": ["-reading_date", "mpan"],
+                "verbose_name": "Reading",
+                "verbose_name_plural": "Readings",
+            },
+        ),
+    ]
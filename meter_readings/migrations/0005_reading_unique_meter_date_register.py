@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("meter_readings", "0004_reading_mpan_meter_serial"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="reading",
+            unique_together={("meter", "reading_date", "register_id")},
+        ),
+        migrations.RemoveIndex(
+            model_name="reading",
+            name="idx_reading_meter_date",
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("meter_readings", "0005_reading_unique_meter_date_register"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="meter",
+            options={"verbose_name": "Meter", "verbose_name_plural": "Meters"},
+        ),
+        migrations.AlterModelOptions(
+            name="meterpoint",
+            options={
+                "verbose_name": "Meter Point",
+                "verbose_name_plural": "Meter Points",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="reading",
+            options={"verbose_name": "Reading", "verbose_name_plural": "Readings"},
+        ),
+    ]
@@ -0,0 +1,31 @@
+import meter_readings.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("meter_readings", "0006_remove_default_ordering"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="meterpoint",
+            name="mpan",
+            field=models.CharField(
+                help_text="Meter Point Administration Number (13 digits)",
+                max_length=13,
+                unique=True,
+                validators=[meter_readings.validators.validate_mpan],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="reading",
+            name="reading_value",
+            field=models.DecimalField(
+                decimal_places=3,
+                max_digits=12,
+                validators=[meter_readings.validators.validate_reading_value],
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("meter_readings", "0007_shared_validators"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="flowfile",
+            index=models.Index(fields=["imported_at"], name="idx_flowfile_imported"),
+        ),
+        # The unique constraint on mpan already provides this index
+        migrations.RemoveIndex(
+            model_name="meterpoint",
+            name="idx_meterpoint_mpan",
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("meter_readings", "0008_flowfile_imported_index"),
+    ]
+
+    operations = [
+        # idx_reading_date_id_desc leads with reading_date, so it serves the
+        # same lookups and range scans
+        migrations.RemoveIndex(
+            model_name="reading",
+            name="idx_reading_date",
+        ),
+    ]
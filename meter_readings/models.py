@@ -1,10 +1,14 @@
 """Models for D0010 meter readings application."""
 
 from django.db import models
-from django.core.validators import RegexValidator
 from django.core.exceptions import ValidationError
 
-import re
+# validate_mpan stays importable from here: migration 0003 references it
+from .validators import (  # noqa: F401
+    is_valid_mpan,
+    validate_mpan,
+    validate_reading_value,
+)
 
 
 class FlowFile(models.Model):
@@ -25,6 +29,8 @@ class FlowFile(models.Model):
         ordering = ["-imported_at"]
         verbose_name = "Flow File"
         verbose_name_plural = "Flow Files"
+        # Every listing (API, admin, dashboard) sorts by import time
+        indexes = [models.Index(fields=["imported_at"], name="idx_flowfile_imported")]
 
     def __str__(self):
         return (
@@ -35,28 +41,25 @@ class FlowFile(models.Model):
 class MeterPoint(models.Model):
     """Represents a meter point (MPAN)."""
 
-    mpan_validator = RegexValidator(
-        regex=r"^\d{13}$", message="MPAN must be exactly 13 digits", code="invalid_mpan"
-    )
-
     mpan = models.CharField(
         max_length=13,
         unique=True,
-        validators=[mpan_validator],
+        validators=[validate_mpan],
         help_text="Meter Point Administration Number (13 digits)",
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ["mpan"]
         verbose_name = "Meter Point"
         verbose_name_plural = "Meter Points"
-        indexes = [models.Index(fields=["mpan"], name="idx_meterpoint_mpan")]
 
-    def clean(self):
-        if self.mpan and not re.match(r"^\d{13}$", self.mpan):
-            raise ValidationError({"mpan": "MPAN must be exactly 13 digits"})
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Keep the copies on Reading in step with an edited MPAN
+        Reading.objects.filter(meter__meter_point=self).exclude(mpan=self.mpan).update(
+            mpan=self.mpan
+        )
 
     def __str__(self):
         return f"MPAN: {self.mpan}"
@@ -92,7 +95,6 @@ class Meter(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ["meter_point__mpan", "serial_number"]
         verbose_name = "Meter"
         verbose_name_plural = "Meters"
         unique_together = [["meter_point", "serial_number"]]
@@ -111,6 +113,15 @@ class Meter(models.Model):
                     {"serial_number": "Serial number cannot be empty"}
                 )
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Keep the copies on Reading in step with an edited serial number or
+        # a move to another meter point
+        mpan = self.meter_point.mpan
+        self.readings.exclude(mpan=mpan, meter_serial=self.serial_number).update(
+            mpan=mpan, meter_serial=self.serial_number
+        )
+
     def __str__(self):
         return f"{self.serial_number} ({self.meter_point.mpan})"
 
@@ -137,37 +148,40 @@ class Reading(models.Model):
     )
     register_id = models.CharField(max_length=2, choices=REGISTER_CHOICES)
     reading_date = models.DateTimeField(help_text="Date and time of the meter reading")
-    reading_value = models.DecimalField(max_digits=12, decimal_places=3)
+    reading_value = models.DecimalField(
+        max_digits=12, decimal_places=3, validators=[validate_reading_value]
+    )
     reading_type = models.CharField(max_length=10, default="ACTUAL")
+    # Copies of meter.meter_point.mpan and meter.serial_number, so listings
+    # render and filter without joining meters and meter points. Set on
+    # save() and by the importer.
+    mpan = models.CharField(max_length=13, db_index=True, editable=False)
+    meter_serial = models.CharField(max_length=20, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ["-reading_date", "meter__meter_point__mpan"]
         verbose_name = "Reading"
         verbose_name_plural = "Readings"
-        unique_together = [["meter", "register_id", "reading_date"]]
+        # Column order lets this unique index also serve (meter,
+        # reading_date) lookups and range scans, so no separate index is kept
+        unique_together = [["meter", "reading_date", "register_id"]]
+        # The (reading_date, id) index also serves reading_date lookups and
+        # range scans, so there is no index on reading_date alone
         indexes = [
-            models.Index(fields=["reading_date"], name="idx_reading_date"),
             models.Index(
-                fields=["meter", "reading_date"], name="idx_reading_meter_date"
+                fields=["-reading_date", "-id"], name="idx_reading_date_id_desc"
             ),
             models.Index(fields=["flow_file"], name="idx_reading_flowfile"),
         ]
 
-    def clean(self):
-        if self.reading_value is not None and self.reading_value < 0:
-            raise ValidationError({"reading_value": "Reading value cannot be negative"})
-
-    @property
-    def mpan(self):
-        return self.meter.meter_point.mpan
-
-    @property
-    def meter_serial(self):
-        return self.meter.serial_number
+    def save(self, *args, **kwargs):
+        # Always copy from the current meter, which may have been reassigned
+        self.mpan = self.meter.meter_point.mpan
+        self.meter_serial = self.meter.serial_number
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return (
-            f"{self.mpan} - {self.meter.serial_number} - "
+            f"{self.mpan} - {self.meter_serial} - "
             f"{self.reading_value} on {self.reading_date.strftime('%Y-%m-%d')}"
         )
@@ -0,0 +1,17 @@
+"""
+API pagination classes for meter readings.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class ReadingCursorPagination(CursorPagination):
+    """
+    Keyset pagination for readings.
+
+    Pages seek on the (reading_date, id) index rather than using OFFSET,
+    so deep pages cost the same as the first one.
+    """
+
+    ordering = ("-reading_date", "-id")
+    page_size = 100
@@ -79,8 +79,6 @@ class MeterSerializer(serializers.ModelSerializer):
 class ReadingSerializer(serializers.ModelSerializer):
     """Serializer for meter readings."""
 
-    mpan = serializers.CharField(source="meter.meter_point.mpan", read_only=True)
-    meter_serial = serializers.CharField(source="meter.serial_number", read_only=True)
     meter_type = serializers.CharField(source="meter.meter_type", read_only=True)
     flow_filename = serializers.CharField(source="flow_file.filename", read_only=True)
 
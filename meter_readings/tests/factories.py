@@ -0,0 +1,29 @@
+"""
+Builders for the model instances the test modules create over and over.
+"""
+
+from typing import Any
+
+from meter_readings.models import FlowFile, Meter, Reading
+
+# Fields every test reading shares unless a test overrides them
+READING_DEFAULTS = {"register_id": "S", "reading_type": "ACTUAL"}
+
+
+def build_reading(meter: Meter, flow_file: FlowFile, **fields: Any) -> Reading:
+    """Return an unsaved reading, ready for save() or bulk_create()."""
+    # bulk_create skips save(), so fill in the MPAN/serial copies up front
+    return Reading(
+        meter=meter,
+        flow_file=flow_file,
+        mpan=meter.meter_point.mpan,
+        meter_serial=meter.serial_number,
+        **(READING_DEFAULTS | fields),
+    )
+
+
+def create_reading(meter: Meter, flow_file: FlowFile, **fields: Any) -> Reading:
+    """Build and save a single reading."""
+    reading = build_reading(meter, flow_file, **fields)
+    reading.save()
+    return reading
@@ -3,6 +3,7 @@
 from django.test import TestCase, RequestFactory
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth.models import User
+from django.urls import reverse
 from django.utils import timezone
 from ..admin import ReadingAdmin, MeterAdmin, MeterPointAdmin, FlowFileAdmin
 from ..models import Reading, Meter, MeterPoint, FlowFile
@@ -11,34 +12,50 @@ from ..models import Reading, Meter, MeterPoint, FlowFile
 class AdminTests(TestCase):
     """Test admin customizations."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.factory = RequestFactory()
-        self.site = AdminSite()
-        self.user = User.objects.create_superuser("admin", "admin@test.com", "password")
-
-        # Create test data
-        self.flow_file = FlowFile.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for the class."""
+        # No password (tests use force_login or set request.user directly)
+        cls.user = User.objects.create_superuser("admin", "admin@test.com", None)
+        cls.flow_file = FlowFile.objects.create(
             filename="test.uff", file_reference="TEST001"
         )
-        self.meter_point = MeterPoint.objects.create(mpan="1234567890123")
-        self.meter = Meter.objects.create(
-            meter_point=self.meter_point, serial_number="SN12345", meter_type="E"
+        cls.meter_point = MeterPoint.objects.create(mpan="1234567890123")
+        cls.meter = Meter.objects.create(
+            meter_point=cls.meter_point, serial_number="SN12345", meter_type="E"
         )
-        self.reading = Reading.objects.create(
-            meter=self.meter,
+        cls.reading = Reading.objects.create(
+            meter=cls.meter,
             reading_value=100.5,
             reading_date=timezone.now(),
             reading_type="N",
-            flow_file=self.flow_file,
+            flow_file=cls.flow_file,
         )
 
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.site = AdminSite()
+
     def test_reading_admin_mpan_display(self):
         """Test MPAN display in reading admin."""
         admin = ReadingAdmin(Reading, self.site)
         result = admin.mpan_display(self.reading)
         self.assertIn("1234567890123", result)
 
+    def test_reading_admin_links_match_reverse(self):
+        """Test cached change URLs match Django's reverse()."""
+        admin = ReadingAdmin(Reading, self.site)
+        self.assertIn(
+            reverse(
+                "admin:meter_readings_meterpoint_change", args=[self.meter_point.pk]
+            ),
+            admin.mpan_display(self.reading),
+        )
+        self.assertIn(
+            reverse("admin:meter_readings_flowfile_change", args=[self.flow_file.pk]),
+            admin.flow_file_display(self.reading),
+        )
+
     def test_reading_admin_meter_serial_display(self):
         """Test meter serial display in reading admin."""
         admin = ReadingAdmin(Reading, self.site)
@@ -54,17 +71,38 @@ class AdminTests(TestCase):
     def test_meter_admin_reading_count(self):
         """Test reading count in meter admin."""
         admin = MeterAdmin(Meter, self.site)
-        self.assertEqual(admin.reading_count(self.meter), 1)
+        request = self.factory.get("/")
+        request.user = self.user
+        meter = admin.get_queryset(request).get(pk=self.meter.pk)
+        self.assertEqual(admin.reading_count(meter), 1)
 
     def test_meter_point_admin_meter_count(self):
         """Test meter count in meter point admin."""
         admin = MeterPointAdmin(MeterPoint, self.site)
-        self.assertEqual(admin.meter_count(self.meter_point), 1)
+        request = self.factory.get("/")
+        request.user = self.user
+        meter_point = admin.get_queryset(request).get(pk=self.meter_point.pk)
+        self.assertEqual(admin.meter_count(meter_point), 1)
 
     def test_meter_point_admin_reading_count(self):
         """Test reading count in meter point admin."""
         admin = MeterPointAdmin(MeterPoint, self.site)
-        self.assertEqual(admin.reading_count(self.meter_point), 1)
+        request = self.factory.get("/")
+        request.user = self.user
+        meter_point = admin.get_queryset(request).get(pk=self.meter_point.pk)
+        self.assertEqual(admin.reading_count(meter_point), 1)
+
+    def test_meter_point_admin_counts_single_query(self):
+        """Test meter point changelist counts come from one query."""
+        admin = MeterPointAdmin(MeterPoint, self.site)
+        request = self.factory.get("/")
+        request.user = self.user
+        with self.assertNumQueries(1):
+            rows = [
+                (admin.meter_count(mp), admin.reading_count(mp))
+                for mp in admin.get_queryset(request)
+            ]
+        self.assertEqual(rows, [(1, 1)])
 
     def test_flow_file_admin_display(self):
         """Test flow file admin list display."""
@@ -84,9 +122,13 @@ class AdminTests(TestCase):
         admin = ReadingAdmin(Reading, self.site)
         request = self.factory.get("/")
         request.user = self.user
-        qs = admin.get_queryset(request)
-        # Check that select_related is used (queryset has query with select_related)
-        self.assertIn("meter_point", str(qs.query))
+        qs = admin.get_changelist_instance(request).get_queryset(request)
+        # Check that list_select_related is applied to the changelist query
+        self.assertIn("meter", qs.query.select_related)
+        self.assertIn("flow_file", qs.query.select_related)
+        # MPAN and serial are read from Reading itself, so meter points are
+        # not joined
+        self.assertFalse(qs.query.select_related["meter"])
 
     def test_reading_admin_flow_file_display(self):
         """Test flow file display in reading admin."""
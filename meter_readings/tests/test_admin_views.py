@@ -3,37 +3,33 @@ Comprehensive tests for admin custom views.
 Tests admin dashboard, file import, and testing utilities.
 """
 
-import os
 import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
 
 from django.contrib.auth.models import User
-from django.test import Client, TestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
 
 from meter_readings.models import FlowFile, Meter, MeterPoint, Reading
+from meter_readings.tests.factories import create_reading
 
+# A one-reading D0010 file for the import action tests
+VALID_UFF = (
+    "ZHV|0000123456|D0010002|D|UDMS|X|MRCY|20231201120000||||OPER| | |\n"
+    "026|1234567890123|V| | |\n"
+    "028|M00123456|S| | |\n"
+    "030|01|20231201100000|12345.000|||T|N| | |\n"
+    "ZPT|00002|\n"
+)
 
-class AdminViewsTest(TestCase):
-    """Test custom admin views and testing dashboard."""
+# Aware timestamp for readings created directly in the tests
+READING_DATE = datetime(2025, 1, 1, tzinfo=timezone.utc)
 
-    def setUp(self):
-        """Set up test environment."""
-        self.client = Client()
 
-        # Create admin user
-        self.admin_user = User.objects.create_superuser(
-            username="admin", email="admin@test.com", password="testpass123"
-        )
-
-        # Create test data
-        self.flow_file = FlowFile.objects.create(
-            filename="test.uff", file_reference="TEST001", record_count=1
-        )
-        self.meter_point = MeterPoint.objects.create(mpan="1234567890123")
-        self.meter = Meter.objects.create(
-            meter_point=self.meter_point, serial_number="SN123", meter_type="S"
-        )
+class AdminViewsAnonymousTest(SimpleTestCase):
+    """Test admin views for anonymous users, which never touch the database."""
 
     def test_testing_dashboard_requires_staff(self):
         """Test testing dashboard requires staff privileges."""
@@ -42,6 +38,45 @@ class AdminViewsTest(TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertIn("/admin/login/", response.url)
 
+
+class AdminViewsTest(TestCase):
+    """Test custom admin views and testing dashboard."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The import actions are tested against one mock shared by the class
+        patcher = patch("meter_readings.admin_views.import_file")
+        cls.mock_import_file = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the admin user and test data once for the class."""
+        # No password: tests log in with force_login, so skip the hashing
+        cls.admin_user = User.objects.create_superuser(
+            username="admin", email="admin@test.com", password=None
+        )
+        cls.flow_file = FlowFile.objects.create(
+            filename="test.uff", file_reference="TEST001", record_count=1
+        )
+        cls.meter_point = MeterPoint.objects.create(mpan="1234567890123")
+        cls.meter = Meter.objects.create(
+            meter_point=cls.meter_point, serial_number="SN123", meter_type="S"
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.mock_import_file.reset_mock(side_effect=True)
+
+        # Each test gets its own sample directory, removed afterwards
+        sample_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(sample_dir.cleanup)
+        self.sample_dir = Path(sample_dir.name)
+        sample_settings = self.settings(SAMPLE_DATA_DIR=self.sample_dir)
+        sample_settings.enable()
+        self.addCleanup(sample_settings.disable)
+
     def test_testing_dashboard_get_request(self):
         """Test GET request to testing dashboard."""
         self.client.force_login(self.admin_user)
@@ -54,38 +89,24 @@ class AdminViewsTest(TestCase):
         self.assertEqual(response.context["stats"]["meter_points"], 1)
 
     def test_testing_dashboard_displays_sample_files(self):
-        """Test dashboard displays sample files from sample_data directory."""
+        """Test dashboard lists the .uff files in SAMPLE_DATA_DIR."""
         self.client.force_login(self.admin_user)
 
-        # Create a temporary sample_data directory
-        base_dir = Path(__file__).resolve().parent.parent.parent
-        sample_dir = base_dir / "sample_data"
-        sample_dir.mkdir(exist_ok=True)
-
-        # Create a test file
-        test_file = sample_dir / "test_sample.uff"
-        test_file.write_text("ZHV|TEST|")
+        (self.sample_dir / "test_sample.uff").write_text("ZHV|TEST|")
 
-        try:
-            response = self.client.get("/admin/testing/")
-            self.assertEqual(response.status_code, 200)
-            self.assertIn("sample_files", response.context)
-        finally:
-            # Cleanup
-            if test_file.exists():
-                test_file.unlink()
+        response = self.client.get("/admin/testing/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [f["name"] for f in response.context["sample_files"]], ["test_sample.uff"]
+        )
 
     def test_clear_all_action(self):
         """Test clear_all action deletes all data."""
         self.client.force_login(self.admin_user)
 
         # Create a reading
-        Reading.objects.create(
-            meter=self.meter,
-            reading_value=100.0,
-            reading_date="2025-01-01 00:00:00",
-            reading_type="N",
-            flow_file=self.flow_file,
+        create_reading(
+            self.meter, self.flow_file, reading_value=100.0, reading_date=READING_DATE
         )
 
         # Verify data exists
@@ -107,33 +128,18 @@ class AdminViewsTest(TestCase):
         self.assertEqual(FlowFile.objects.count(), 0)
 
     def test_import_file_action_success(self):
-        """Test import_file action with valid file."""
+        """Test import_file action imports the posted file."""
         self.client.force_login(self.admin_user)
 
-        # Create temporary test file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(
-                "ZHV|0000123456|D0010002|D|UDMS|X|MRCY|20231201120000||||OPER| | |\n"
-            )
-            f.write("026|1234567890123|V| | |\n")
-            f.write("028|M00123456|S| | |\n")
-            f.write("030|01|20231201100000|12345.000|||T|N| | |\n")
-            f.write("ZPT|00002|\n")
-            temp_path = f.name
-
-        try:
-            response = self.client.post(
-                "/admin/testing/", {"action": "import_file", "file_path": temp_path}
-            )
+        temp_path = self.sample_dir / "import_me.uff"
+        temp_path.write_text(VALID_UFF)
 
-            self.assertEqual(response.status_code, 302)
+        response = self.client.post(
+            "/admin/testing/", {"action": "import_file", "file_path": str(temp_path)}
+        )
 
-            # Verify import occurred (check for increased counts)
-            self.assertGreater(FlowFile.objects.count(), 1)
-        finally:
-            # Cleanup
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        self.assertEqual(response.status_code, 302)
+        self.mock_import_file.assert_called_once_with(str(temp_path))
 
     def test_import_file_action_invalid_path(self):
         """Test import_file action with non-existent file."""
@@ -146,116 +152,86 @@ class AdminViewsTest(TestCase):
 
         # Should redirect without error
         self.assertEqual(response.status_code, 302)
+        self.mock_import_file.assert_not_called()
 
-    @patch("meter_readings.admin_views.call_command")
-    def test_import_file_action_command_error(self, mock_call_command):
+    def test_import_file_action_command_error(self):
         """Test import_file action handles command errors."""
         self.client.force_login(self.admin_user)
-        mock_call_command.side_effect = Exception("Import failed")
+        self.mock_import_file.side_effect = Exception("Import failed")
 
-        # Create temporary test file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write("invalid content")
-            temp_path = f.name
+        temp_path = self.sample_dir / "invalid.uff"
+        temp_path.write_text("invalid content")
 
-        try:
-            response = self.client.post(
-                "/admin/testing/", {"action": "import_file", "file_path": temp_path}
-            )
+        response = self.client.post(
+            "/admin/testing/", {"action": "import_file", "file_path": str(temp_path)}
+        )
 
-            # Should still redirect
-            self.assertEqual(response.status_code, 302)
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        # Should still redirect
+        self.assertEqual(response.status_code, 302)
 
     def test_import_all_action_imports_new_files(self):
         """Test import_all action imports files not yet imported."""
         self.client.force_login(self.admin_user)
 
-        # Create sample_data directory with test files
-        base_dir = Path(__file__).resolve().parent.parent.parent
-        sample_dir = base_dir / "sample_data"
-        sample_dir.mkdir(exist_ok=True)
-
-        test_file = sample_dir / "import_test.uff"
-        test_file.write_text(
-            "ZHV|0000123456|D0010002|D|UDMS|X|MRCY|20231201120000||||OPER| | |\n"
-            "026|1234567890123|V| | |\n"
-            "028|M00123456|S| | |\n"
-            "030|01|20231201100000|12345.000|||T|N| | |\n"
-            "ZPT|00002|\n"
-        )
+        test_file = self.sample_dir / "import_test.uff"
+        test_file.write_text(VALID_UFF)
 
-        try:
-            response = self.client.post("/admin/testing/", {"action": "import_all"})
+        response = self.client.post("/admin/testing/", {"action": "import_all"})
 
-            self.assertEqual(response.status_code, 302)
-        finally:
-            # Cleanup
-            if test_file.exists():
-                test_file.unlink()
+        self.assertEqual(response.status_code, 302)
+        self.mock_import_file.assert_called_once_with(str(test_file))
 
     def test_import_all_action_skips_imported_files(self):
         """Test import_all skips files already imported."""
         self.client.force_login(self.admin_user)
 
-        # Create sample_data directory
-        base_dir = Path(__file__).resolve().parent.parent.parent
-        sample_dir = base_dir / "sample_data"
-        sample_dir.mkdir(exist_ok=True)
-
-        # Create test file
-        test_file = sample_dir / "already_imported.uff"
-        test_file.write_text("ZHV|TEST|")
+        (self.sample_dir / "already_imported.uff").write_text("ZHV|TEST|")
 
         # Mark as already imported
         FlowFile.objects.create(filename="already_imported.uff")
 
-        try:
-            response = self.client.post("/admin/testing/", {"action": "import_all"})
+        response = self.client.post("/admin/testing/", {"action": "import_all"})
 
-            self.assertEqual(response.status_code, 302)
-            # File should still only exist once
-            self.assertEqual(
-                FlowFile.objects.filter(filename="already_imported.uff").count(), 1
-            )
-        finally:
-            if test_file.exists():
-                test_file.unlink()
+        self.assertEqual(response.status_code, 302)
+        self.mock_import_file.assert_not_called()
 
-    @patch("meter_readings.admin_views.call_command")
-    def test_import_all_action_handles_errors(self, mock_call_command):
-        """Test import_all handles import errors gracefully."""
+    def test_import_all_action_ignores_stale_file_list(self):
+        """Test import_all rechecks import status instead of using the cache."""
         self.client.force_login(self.admin_user)
-        mock_call_command.side_effect = Exception("Import error")
 
-        # Create sample file
-        base_dir = Path(__file__).resolve().parent.parent.parent
-        sample_dir = base_dir / "sample_data"
-        sample_dir.mkdir(exist_ok=True)
+        (self.sample_dir / "late_import.uff").write_text("ZHV|TEST|")
 
-        test_file = sample_dir / "error_test.uff"
-        test_file.write_text("BAD DATA")
+        # Cache the file list while the file is still unimported
+        self.client.get("/admin/testing/")
+        FlowFile.objects.create(filename="late_import.uff")
 
-        try:
-            response = self.client.post("/admin/testing/", {"action": "import_all"})
+        self.client.post("/admin/testing/", {"action": "import_all"})
 
-            # Should still redirect successfully
-            self.assertEqual(response.status_code, 302)
-        finally:
-            if test_file.exists():
-                test_file.unlink()
+        self.mock_import_file.assert_not_called()
+
+    def test_import_all_action_handles_errors(self):
+        """Test import_all handles import errors gracefully."""
+        self.client.force_login(self.admin_user)
+        self.mock_import_file.side_effect = Exception("Import error")
+
+        (self.sample_dir / "error_test.uff").write_text("BAD DATA")
+
+        response = self.client.post("/admin/testing/", {"action": "import_all"})
+
+        # Should still redirect successfully
+        self.assertEqual(response.status_code, 302)
 
     def test_recent_files_displayed(self):
         """Test recent_files are shown in dashboard context."""
         self.client.force_login(self.admin_user)
 
         # Create additional flow files
-        for i in range(10):
-            FlowFile.objects.create(
+        FlowFile.objects.bulk_create(
+            FlowFile(
                 filename=f"file_{i}.uff", file_reference=f"REF{i:03d}", record_count=i
             )
+            for i in range(10)
+        )
 
         response = self.client.get("/admin/testing/")
 
@@ -274,12 +250,11 @@ class AdminViewsTest(TestCase):
             meter = Meter.objects.create(
                 meter_point=mp, serial_number=f"SN{i}", meter_type="S"
             )
-            Reading.objects.create(
-                meter=meter,
+            create_reading(
+                meter,
+                self.flow_file,
                 reading_value=100.0 * i,
-                reading_date="2025-01-01 00:00:00",
-                reading_type="N",
-                flow_file=self.flow_file,
+                reading_date=READING_DATE,
             )
 
         response = self.client.get("/admin/testing/")
@@ -290,6 +265,19 @@ class AdminViewsTest(TestCase):
         self.assertEqual(stats["meters"], 4)
         self.assertEqual(stats["readings"], 3)
 
+    def test_dashboard_stats_cached_between_requests(self):
+        """Test dashboard stats are served from cache until invalidated."""
+        self.client.force_login(self.admin_user)
+        self.client.get("/admin/testing/")
+
+        FlowFile.objects.create(filename="late.uff", file_reference="LATE")
+        response = self.client.get("/admin/testing/")
+        self.assertEqual(response.context["stats"]["flow_files"], 1)
+
+        self.client.post("/admin/testing/", {"action": "clear_all"})
+        response = self.client.get("/admin/testing/")
+        self.assertEqual(response.context["stats"]["flow_files"], 0)
+
     def test_unknown_action_ignored(self):
         """Test unknown POST action is handled gracefully."""
         self.client.force_login(self.admin_user)
@@ -5,73 +5,184 @@ API endpoint tests for meter readings.
 import io
 from unittest.mock import patch
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from datetime import datetime, timezone
 
 from meter_readings.models import FlowFile, MeterPoint, Meter, Reading
+from meter_readings.tests.factories import build_reading, create_reading
+from meter_readings.utils import bump_readings_cache_version
 
 User = get_user_model()
 
+# A one-reading D0010 file for the upload tests
+VALID_UFF = (
+    b"ZHV|0000475702|D0010002|D|UDMS|X|MRCY|20250115120000||||OPER| | |\n"
+    b"026|9876543210987|V| | |\n"
+    b"028|UPLOAD001|S| | |\n"
+    b"030|S|20250115120000|54321.000|||A|N| | |\n"
+)
+INVALID_UFF = b"INVALID UFF CONTENT"
+
 
 class APITestCase(TestCase):
     """Test REST API endpoints."""
 
-    def setUp(self):
-        """Create test data."""
-        self.client = APIClient()
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for the class."""
+        # No password: tests authenticate with force_authenticate, so skip
+        # the deliberately slow password hashing
+        cls.api_user = User.objects.create_user(username="testuser")
 
-        # Create test data
-        self.flow_file = FlowFile.objects.create(
+        cls.flow_file = FlowFile.objects.create(
             filename="test.uff", file_reference="TEST001", record_count=2
         )
 
-        self.meter_point = MeterPoint.objects.create(mpan="1234567890123")
+        cls.meter_point = MeterPoint.objects.create(mpan="1234567890123")
 
-        self.meter = Meter.objects.create(
-            meter_point=self.meter_point, serial_number="TEST001", meter_type="S"
+        cls.meter = Meter.objects.create(
+            meter_point=cls.meter_point, serial_number="TEST001", meter_type="S"
         )
 
-        self.reading = Reading.objects.create(
-            meter=self.meter,
-            register_id="S",
+        cls.reading = create_reading(
+            cls.meter,
+            cls.flow_file,
             reading_date=datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc),
             reading_value=12345.67,
-            reading_type="ACTUAL",
-            flow_file=self.flow_file,
         )
 
-    def test_list_meter_points(self):
-        """Test listing meter points."""
-        response = self.client.get("/api/meter-points/", follow=True)
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data["results"]), 1)
-        self.assertEqual(response.data["results"][0]["mpan"], "1234567890123")
+    def test_list_endpoints(self):
+        """Test each list endpoint returns the fixture row in bounded queries."""
+        cases = [
+            # url name, queries, field, expected value
+            ("meterpoint-list", 2, "mpan", "1234567890123"),
+            ("meter-list", 2, "serial_number", "TEST001"),
+            ("flowfile-list", 2, "filename", "test.uff"),
+            ("reading-list", 1, "mpan", "1234567890123"),
+        ]
+
+        for name, queries, field, expected in cases:
+            with self.subTest(name=name):
+                with self.assertNumQueries(queries):
+                    response = self.client.get(reverse(name))
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.data["results"]), 1)
+                self.assertEqual(response.data["results"][0][field], expected)
+
+    def test_retrieve_endpoints(self):
+        """Test each detail endpoint returns the fixture row in bounded queries."""
+        cases = [
+            # url name, pk, queries, expected fields, nested keys
+            (
+                "meterpoint-detail",
+                self.meter_point.pk,
+                2,
+                {"mpan": "1234567890123"},
+                ["meters"],
+            ),
+            (
+                "flowfile-detail",
+                self.flow_file.pk,
+                1,
+                {"filename": "test.uff", "file_reference": "TEST001"},
+                [],
+            ),
+            (
+                "meter-detail",
+                self.meter.pk,
+                1,
+                {"serial_number": "TEST001", "meter_type": "S"},
+                [],
+            ),
+            ("reading-detail", self.reading.pk, 1, {}, ["meter", "flow_file"]),
+        ]
+
+        for name, pk, queries, expected, nested in cases:
+            with self.subTest(name=name):
+                with self.assertNumQueries(queries):
+                    response = self.client.get(reverse(name, args=[pk]))
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                for field, value in expected.items():
+                    self.assertEqual(response.data[field], value)
+                for key in nested:
+                    self.assertIn(key, response.data)
+
+    def test_meter_point_counts(self):
+        """Test meter and reading counts, including empty meter points."""
+        Meter.objects.create(
+            meter_point=self.meter_point, serial_number="TEST002", meter_type="S"
+        )
+        MeterPoint.objects.create(mpan="9999999999999")
 
-    def test_retrieve_meter_point(self):
-        """Test retrieving single meter point."""
         response = self.client.get(
-            f"/api/meter-points/{self.meter_point.pk}/", follow=True
+            reverse("meterpoint-list"), {"ordering": "-reading_count"}
         )
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["mpan"], "1234567890123")
-        self.assertIn("meters", response.data)
+        counts = [
+            (r["mpan"], r["meter_count"], r["reading_count"])
+            for r in response.data["results"]
+        ]
+        self.assertEqual(counts, [("1234567890123", 2, 1), ("9999999999999", 0, 0)])
 
-    def test_list_readings(self):
-        """Test listing readings."""
-        response = self.client.get("/api/readings/", follow=True)
+    def test_retrieve_meter_point_meters_ordered(self):
+        """Test nested meters are listed by serial number."""
+        Meter.objects.create(meter_point=self.meter_point, serial_number="ABC001")
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(
+            reverse("meterpoint-detail", args=[self.meter_point.pk])
+        )
+
+        self.assertEqual(
+            [meter["serial_number"] for meter in response.data["meters"]],
+            ["ABC001", "TEST001"],
+        )
+
+    def test_list_readings_single_narrow_query(self):
+        """Test reading list loads only rendered columns with no extra fetches."""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("reading-list"))
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(response.data["results"][0]["mpan"], "1234567890123")
+        self.assertEqual(response.data["results"][0]["flow_filename"], "test.uff")
+        self.assertNotIn("record_count", ctx.captured_queries[0]["sql"])
+
+    def test_list_readings_cached_until_version_bump(self):
+        """Test reading list is served from cache until imports bump it."""
+        response = self.client.get(reverse("reading-list"))
+        # Sessions must not share cached pages
+        self.assertIn("Cookie", response["Vary"])
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("reading-list"))
         self.assertEqual(len(response.data["results"]), 1)
 
+        create_reading(
+            self.meter,
+            self.flow_file,
+            reading_date=datetime(2025, 1, 16, 12, 0, tzinfo=timezone.utc),
+            reading_value=12350,
+        )
+        bump_readings_cache_version()
+
+        response = self.client.get(reverse("reading-list"))
+        self.assertEqual(len(response.data["results"]), 2)
+
     def test_filter_readings_by_mpan(self):
         """Test filtering readings by MPAN."""
-        response = self.client.get(
-            "/api/readings/", {"mpan": "1234567890123"}, follow=True
-        )
+        response = self.client.get(reverse("reading-list"), {"mpan": "1234567890123"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 1)
@@ -79,9 +190,8 @@ class APITestCase(TestCase):
     def test_filter_readings_by_date(self):
         """Test filtering readings by date range."""
         response = self.client.get(
-            "/api/readings/",
+            reverse("reading-list"),
             {"date_from": "2025-01-01", "date_to": "2025-01-31"},
-            follow=True,
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -89,123 +199,134 @@ class APITestCase(TestCase):
 
     def test_readings_summary(self):
         """Test readings summary endpoint."""
-        response = self.client.get("/api/readings/summary/", follow=True)
+        response = self.client.get(reverse("reading-summary"))
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["total_readings"], 1)
         self.assertEqual(response.data["total_meter_points"], 1)
         self.assertEqual(response.data["total_meters"], 1)
 
+    def test_readings_summary_groups_by_type(self):
+        """Test summary totals and per-type counts across several readings."""
+        for day, reading_type in ((16, "ACTUAL"), (17, "ESTIMATED")):
+            create_reading(
+                self.meter,
+                self.flow_file,
+                reading_date=datetime(2025, 1, day, 12, 0, tzinfo=timezone.utc),
+                reading_value=12400 + day,
+                reading_type=reading_type,
+            )
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("reading-summary"))
+
+        self.assertEqual(response.data["total_readings"], 3)
+        self.assertEqual(response.data["total_meters"], 1)
+        self.assertEqual(response.data["reading_types"], {"ACTUAL": 2, "ESTIMATED": 1})
+        self.assertEqual(
+            response.data["date_range"]["earliest"],
+            datetime(2025, 1, 15, 12, 0, tzinfo=timezone.utc),
+        )
+
     def test_meter_point_readings_action(self):
         """Test custom action to get readings for a meter point."""
         response = self.client.get(
-            f"/api/meter-points/{self.meter_point.pk}/readings/", follow=True
+            reverse("meterpoint-readings", args=[self.meter_point.pk])
         )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(len(response.data["results"]), 1)
 
     def test_api_pagination(self):
         """Test API pagination."""
-        # Create more readings with unique dates/times to avoid constraint violations
-        for i in range(150):
-            Reading.objects.create(
-                meter=self.meter,
-                register_id="S",
+        # Create more readings with unique dates/times to avoid constraint
+        # violations
+        Reading.objects.bulk_create(
+            build_reading(
+                self.meter,
+                self.flow_file,
                 reading_date=datetime(
                     2025, 1, (i % 28) + 1, i % 24, i % 60, tzinfo=timezone.utc
                 ),  # Unique timestamps
                 reading_value=i * 100,
-                reading_type="ACTUAL",
-                flow_file=self.flow_file,
             )
+            for i in range(150)
+        )
 
-        response = self.client.get("/api/readings/", follow=True)
+        response = self.client.get(reverse("reading-list"))
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 100)  # PAGE_SIZE
         self.assertIsNotNone(response.data["next"])
 
-    def test_list_flow_files(self):
-        """Test listing flow files."""
-        response = self.client.get("/api/flow-files/", follow=True)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data["results"]), 1)
-        self.assertEqual(response.data["results"][0]["filename"], "test.uff")
-
-    def test_retrieve_flow_file(self):
-        """Test retrieving single flow file."""
-        response = self.client.get(f"/api/flow-files/{self.flow_file.pk}/", follow=True)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["filename"], "test.uff")
-        self.assertEqual(response.data["file_reference"], "TEST001")
+        # Cursor pagination: the next link seeks past the first page
+        self.assertIn("cursor=", response.data["next"])
+        next_response = self.client.get(response.data["next"])
+        self.assertEqual(len(next_response.data["results"]), 51)
+        self.assertIsNone(next_response.data["next"])
+        first_ids = {r["id"] for r in response.data["results"]}
+        next_ids = {r["id"] for r in next_response.data["results"]}
+        self.assertFalse(first_ids & next_ids)
 
-    def test_list_meters(self):
-        """Test listing meters."""
-        response = self.client.get("/api/meters/", follow=True)
+    def test_meter_readings_action(self):
+        """Test custom action to get readings for a meter."""
+        response = self.client.get(reverse("meter-readings", args=[self.meter.pk]))
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 1)
         self.assertEqual(len(response.data["results"]), 1)
-        self.assertEqual(response.data["results"][0]["serial_number"], "TEST001")
-
-    def test_retrieve_meter(self):
-        """Test retrieving single meter."""
-        response = self.client.get(f"/api/meters/{self.meter.pk}/", follow=True)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["serial_number"], "TEST001")
-        self.assertEqual(response.data["meter_type"], "S")
 
-    def test_meter_readings_action(self):
-        """Test custom action to get readings for a meter."""
-        response = self.client.get(
-            f"/api/meters/{self.meter.pk}/readings/", follow=True
+    def test_reading_actions_constant_queries(self):
+        """Test nested reading lists don't fetch related rows per reading."""
+        create_reading(
+            self.meter,
+            self.flow_file,
+            reading_date=datetime(2025, 2, 15, 12, 0, tzinfo=timezone.utc),
+            reading_value=12400.0,
         )
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
+        for url in (
+            reverse("meter-readings", args=[self.meter.pk]),
+            reverse("meterpoint-readings", args=[self.meter_point.pk]),
+        ):
+            with self.subTest(url=url):
+                # Object lookup, page count, page of readings
+                with self.assertNumQueries(3):
+                    response = self.client.get(url)
+                self.assertEqual(response.data["results"][0]["meter_type"], "S")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("reading-detail", args=[self.reading.id])
+            )
+        self.assertEqual(response.data["meter"]["mpan"], "1234567890123")
 
     def test_search_functionality(self):
         """Test search across MPAN and serial number."""
-        response = self.client.get(
-            "/api/readings/", {"search": "1234567890123"}, follow=True
-        )
+        response = self.client.get(reverse("reading-list"), {"search": "1234567890123"})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreater(len(response.data["results"]), 0)
 
-    def test_reading_detail_serializer(self):
-        """Test reading detail endpoint uses detailed serializer."""
-        response = self.client.get(f"/api/readings/{self.reading.id}/", follow=True)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn("meter", response.data)
-        self.assertIn("flow_file", response.data)
-
     def test_meter_serial_filter(self):
         """Test filtering readings by meter serial number."""
-        response = self.client.get(
-            "/api/readings/", {"meter_serial": "TEST001"}, follow=True
-        )
+        response = self.client.get(reverse("reading-list"), {"meter_serial": "TEST001"})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreater(len(response.data["results"]), 0)
 
+    def test_schema_endpoint(self):
+        """Test lazily loaded OpenAPI schema view responds."""
+        response = self.client.get(reverse("schema"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_upload_file_unauthenticated(self):
         """Test upload requires authentication."""
-        # Create a simple UFF file content
-        uff_content = (
-            b"ZHV|0000475701|D0010002|D|UDMS|X|MRCY|20250115120000||||OPER| | |\n"
-            b"026|1234567890123|V| | |\n"
-            b"028|TEST001|S| | |\n"
-            b"030|S|20250115120000|12345.000|||A|N| | |\n"
-        )
-
-        file = io.BytesIO(uff_content)
+        file = io.BytesIO(VALID_UFF)
         file.name = "test_upload.uff"
 
         response = self.client.post(
-            "/api/flow-files/upload/", {"file": file}, format="multipart"
+            reverse("flowfile-upload"), {"file": file}, format="multipart"
         )
 
         # Should require authentication (403 or 401)
@@ -216,23 +337,13 @@ class APITestCase(TestCase):
 
     def test_upload_file_authenticated(self):
         """Test successful file upload with authentication."""
-        # Create test user
-        user = User.objects.create_user(username="testuser", password="testpass123")
-        self.client.force_authenticate(user=user)
-
-        # Create a valid UFF file content (based on actual D0010 format)
-        uff_content = (
-            b"ZHV|0000475702|D0010002|D|UDMS|X|MRCY|20250115120000||||OPER| | |\n"
-            b"026|9876543210987|V| | |\n"
-            b"028|UPLOAD001|S| | |\n"
-            b"030|S|20250115120000|54321.000|||A|N| | |\n"
-        )
+        self.client.force_authenticate(user=self.api_user)
 
-        file = io.BytesIO(uff_content)
+        file = io.BytesIO(VALID_UFF)
         file.name = "test_upload_auth.uff"
 
         response = self.client.post(
-            "/api/flow-files/upload/", {"file": file}, format="multipart"
+            reverse("flowfile-upload"), {"file": file}, format="multipart"
         )
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -244,64 +355,57 @@ class APITestCase(TestCase):
         flow_file = FlowFile.objects.get(filename="test_upload_auth.uff")
         self.assertEqual(flow_file.record_count, 1)
 
-    def test_upload_invalid_file_type(self):
-        """Test upload rejects non-UFF files."""
-        user = User.objects.create_user(username="testuser", password="testpass123")
-        self.client.force_authenticate(user=user)
+    @override_settings(FILE_UPLOAD_MAX_MEMORY_SIZE=0)
+    def test_upload_file_spooled_to_disk(self):
+        """Test upload of a file Django has already written to a temp file."""
+        self.client.force_authenticate(user=self.api_user)
 
-        # Create a non-UFF file
-        file = io.BytesIO(b"This is not a UFF file")
-        file.name = "test.txt"
+        file = io.BytesIO(VALID_UFF)
+        file.name = "test_upload_disk.uff"
 
         response = self.client.post(
-            "/api/flow-files/upload/", {"file": file}, format="multipart"
+            reverse("flowfile-upload"), {"file": file}, format="multipart"
         )
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn("file", response.data)
-
-    def test_upload_invalid_uff_content(self):
-        """Test upload handles invalid UFF content."""
-        user = User.objects.create_user(username="testuser", password="testpass123")
-        self.client.force_authenticate(user=user)
-
-        # Create invalid UFF content
-        uff_content = b"INVALID UFF CONTENT"
-
-        file = io.BytesIO(uff_content)
-        file.name = "invalid.uff"
-
-        response = self.client.post(
-            "/api/flow-files/upload/", {"file": file}, format="multipart"
-        )
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn("error", response.data)
-
-    @patch("meter_readings.api_views.call_command")
-    def test_upload_import_exception(self, mock_call_command):
-        """Test upload handles exceptions during import."""
-        user = User.objects.create_user(username="testuser", password="testpass123")
-        self.client.force_authenticate(user=user)
-
-        # Mock call_command to raise an exception
-        mock_call_command.side_effect = Exception("Database connection failed")
-
-        # Create a valid UFF file content
-        uff_content = (
-            b"ZHV|0000475703|D0010002|D|UDMS|X|MRCY|20250115120000||||OPER| | |\n"
-            b"026|1111222233334|V| | |\n"
-            b"028|EXCEPTION001|S| | |\n"
-            b"030|S|20250115120000|99999.000|||A|N| | |\n"
-        )
-
-        file = io.BytesIO(uff_content)
-        file.name = "exception_test.uff"
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["record_count"], 1)
 
-        response = self.client.post(
-            "/api/flow-files/upload/", {"file": file}, format="multipart"
-        )
+    def test_upload_rejected(self):
+        """Test uploads failing validation or import return 400 and save nothing."""
+        self.client.force_authenticate(user=self.api_user)
+        cases = [
+            # filename, content, error key
+            ("test.txt", b"This is not a UFF file", "file"),
+            ("invalid.uff", INVALID_UFF, "error"),
+        ]
+
+        for filename, content, error_key in cases:
+            with self.subTest(filename=filename):
+                file = io.BytesIO(content)
+                file.name = filename
+
+                response = self.client.post(
+                    reverse("flowfile-upload"), {"file": file}, format="multipart"
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn(error_key, response.data)
+                self.assertFalse(FlowFile.objects.filter(filename=filename).exists())
+                self.assertEqual(Reading.objects.count(), 1)
+
+    def test_upload_import_error(self):
+        """Test an unexpected import failure returns 400 with the cause."""
+        self.client.force_authenticate(user=self.api_user)
+        file = io.BytesIO(VALID_UFF)
+        file.name = "exception.uff"
+
+        with patch(
+            "meter_readings.api_views.import_file",
+            side_effect=Exception("Database connection failed"),
+        ):
+            response = self.client.post(
+                reverse("flowfile-upload"), {"file": file}, format="multipart"
+            )
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn("error", response.data)
         self.assertIn("Database connection failed", response.data["error"])
@@ -8,10 +8,21 @@ are expected and indicate the parser is correctly handling the file format.
 import os
 import tempfile
 from io import StringIO
-from django.test import TestCase
-from django.core.management import call_command
+from pathlib import Path
+from unittest import skipUnless
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.core.management import CommandError, call_command
+from meter_readings.exceptions import D0010ImportError
+from meter_readings.management.commands.import_d0010 import (
+    _copy_row,
+    parse_d0010_bytes,
+)
 from meter_readings.models import MeterPoint, Meter, Reading, FlowFile
 
+# Keep test files in RAM where tmpfs is available
+SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
 class ImportD0010CommandTest(TestCase):
     def setUp(self):
@@ -23,27 +34,248 @@ class ImportD0010CommandTest(TestCase):
             "ZPT|0000475656|35||11|20160302154650| |"
         )
 
-        self.temp_file = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".uff", delete=False
-        )
-        self.temp_file.write(self.sample_content)
-        self.temp_file.close()
+        # Scratch directory for this test's files, removed afterwards
+        scratch = tempfile.TemporaryDirectory(dir=SCRATCH_DIR)
+        self.addCleanup(scratch.cleanup)
+        self.scratch_dir = Path(scratch.name)
+        self.temp_path = self.write_uff(self.sample_content)
 
-    def tearDown(self):
-        os.unlink(self.temp_file.name)
+    def write_uff(self, content: str) -> str:
+        """Write content to a new .uff file in the scratch directory."""
+        path = self.scratch_dir / f"test_{len(os.listdir(self.scratch_dir))}.uff"
+        path.write_text(content)
+        return str(path)
 
     def test_successful_import(self):
         """Test successful import of valid D0010 file."""
-        call_command("import_d0010", self.temp_file.name)
+        call_command("import_d0010", self.temp_path)
 
         self.assertEqual(FlowFile.objects.count(), 1)
         self.assertEqual(MeterPoint.objects.count(), 1)
         self.assertEqual(Meter.objects.count(), 1)
         self.assertEqual(Reading.objects.count(), 1)
 
+        reading = Reading.objects.get()
+        self.assertEqual(reading.mpan, "1200023305967")
+        self.assertEqual(reading.meter_serial, "F75A 00802")
+
+    def test_overlapping_readings_not_duplicated(self):
+        """Test existing readings are skipped and meter types upserted."""
+        call_command("import_d0010", self.temp_path)
+
+        content = (
+            "ZHV|0000475657|D0010002|D|UDMS|X|MRCY|20160303153151||||OPER| | |\n"
+            "026|1200023305967|V| | |\n"
+            "028|F75A 00802|C| | |\n"
+            "030|S|20160222000000|56311.0|||T|N| | |\n"
+            "030|S|20160223000000|56320.0|||T|N| | |\n"
+            "ZPT|0000475657|35||11|20160303154650| |"
+        )
+        path = self.write_uff(content)
+        call_command("import_d0010", path)
+
+        self.assertEqual(MeterPoint.objects.count(), 1)
+        self.assertEqual(Meter.objects.get().meter_type, "C")
+        self.assertEqual(Reading.objects.count(), 2)
+        second = FlowFile.objects.get(filename=os.path.basename(path))
+        self.assertEqual(second.record_count, 1)
+
+    def test_fast_import_matches_orm_import(self):
+        """Test --fast stores the same readings and still skips duplicates."""
+        from datetime import datetime
+        from decimal import Decimal
+        from zoneinfo import ZoneInfo
+
+        call_command("import_d0010", self.temp_path, fast=True, stdout=StringIO())
+
+        reading = Reading.objects.select_related("meter__meter_point").get()
+        self.assertEqual(reading.meter.meter_point.mpan, "1200023305967")
+        self.assertEqual(reading.mpan, "1200023305967")
+        self.assertEqual(reading.meter_serial, "F75A 00802")
+        self.assertEqual(
+            reading.reading_date,
+            datetime(2016, 2, 22, tzinfo=ZoneInfo("Europe/London")),
+        )
+        self.assertEqual(reading.reading_value, Decimal("56311.0"))
+        self.assertIsNotNone(reading.created_at)
+        self.assertEqual(FlowFile.objects.get().record_count, 1)
+
+        renamed = self.write_uff(self.sample_content)
+        call_command("import_d0010", renamed, fast=True, stdout=StringIO())
+        self.assertEqual(Reading.objects.count(), 1)
+
+    def test_copy_row_format(self):
+        """Test reading rows are escaped and serialised for COPY text format."""
+        from datetime import datetime
+        from decimal import Decimal
+        from zoneinfo import ZoneInfo
+
+        row = (
+            7,
+            3,
+            "S",
+            datetime(2016, 2, 22, tzinfo=ZoneInfo("Europe/London")),
+            Decimal("56311.000"),
+            "ACTUAL",
+            None,
+            "A\tB\nC\\D\r",
+        )
+        self.assertEqual(
+            _copy_row(row),
+            "7\t3\tS\t2016-02-22 00:00:00+00:00\t56311.000\tACTUAL\t\\N\t"
+            "A\\tB\\nC\\\\D\\r\n",
+        )
+
+    @skipUnless(connection.vendor == "postgresql", "COPY path is PostgreSQL only")
+    def test_copy_import_across_batches(self):
+        """Test COPY imports several batches per file and skips duplicates."""
+        from datetime import datetime
+        from decimal import Decimal
+        from zoneinfo import ZoneInfo
+
+        content = (
+            "ZHV|0000475659|D0010002|D|UDMS|X|MRCY|20160302153151||||OPER| | |\n"
+            "026|1200023305967|V| | |\n"
+            "028|F75A 00802|D| | |\n"
+            "030|S|20160222000000|56311.0|||T|N| | |\n"
+            "030|S|20160223000000|56320.5|||T|N| | |\n"
+            "030|S|20161030013000|56330.25|||T|N| | |\n"
+            "ZPT|0000475659|35||11|20160302154650| |"
+        )
+        first = self.write_uff(content)
+        second = self.write_uff(content)
+        with override_settings(D0010_BULK_BATCH_SIZE=1):
+            call_command("import_d0010", first, stdout=StringIO())
+            call_command("import_d0010", second, stdout=StringIO())
+
+        self.assertEqual(Reading.objects.count(), 3)
+        self.assertEqual(
+            list(FlowFile.objects.order_by("id").values_list("record_count")),
+            [(3,), (0,)],
+        )
+        reading = Reading.objects.get(reading_value=Decimal("56320.5"))
+        self.assertEqual(reading.register_id, "S")
+        self.assertEqual(reading.reading_type, "ACTUAL")
+        self.assertEqual(reading.mpan, "1200023305967")
+        self.assertEqual(reading.meter_serial, "F75A 00802")
+        self.assertEqual(
+            reading.reading_date,
+            datetime(2016, 2, 23, tzinfo=ZoneInfo("Europe/London")),
+        )
+        self.assertIsNotNone(reading.created_at)
+
+    @skipUnless(connection.vendor == "postgresql", "indexes are dropped on PostgreSQL")
+    def test_optimize_indexes_import(self):
+        """Test --optimize-indexes drops the indexes once and rebuilds them."""
+        from unittest.mock import patch
+
+        from meter_readings.management.commands import import_d0010
+
+        def index_names():
+            with connection.cursor() as cursor:
+                return set(
+                    connection.introspection.get_constraints(
+                        cursor, Reading._meta.db_table
+                    )
+                )
+
+        names = {index.name for index in Reading._meta.indexes}
+        present_during_import = []
+
+        def save_file_data(*args, **kwargs):
+            present_during_import.append(names & index_names())
+            return original_save(*args, **kwargs)
+
+        original_save = import_d0010.save_file_data
+        original_add = connection.SchemaEditorClass.add_index
+        second = self.write_uff(self.sample_content.replace("56311.0", "56312.0"))
+        with patch.object(
+            import_d0010, "save_file_data", side_effect=save_file_data
+        ), patch.object(
+            connection.SchemaEditorClass,
+            "add_index",
+            autospec=True,
+            side_effect=original_add,
+        ) as add_index:
+            call_command(
+                "import_d0010",
+                self.temp_path,
+                second,
+                optimize_indexes=True,
+                stdout=StringIO(),
+            )
+
+        self.assertEqual(Reading.objects.count(), 1)
+        self.assertEqual(present_during_import, [set(), set()])
+        self.assertEqual(add_index.call_count, len(names))
+        self.assertLessEqual(names, index_names())
+
+    @skipUnless(connection.vendor != "postgresql", "workers run on PostgreSQL")
+    def test_workers_require_postgresql(self):
+        """Test --workers > 1 is rejected on backends with a single writer."""
+        with self.assertRaisesMessage(CommandError, "requires PostgreSQL"):
+            call_command("import_d0010", self.temp_path, workers=2, stdout=StringIO())
+        self.assertFalse(FlowFile.objects.exists())
+
+    def test_optimize_indexes_rejects_workers(self):
+        """Test --optimize-indexes cannot be combined with parallel workers."""
+        with self.assertRaisesMessage(CommandError, "--optimize-indexes"):
+            call_command(
+                "import_d0010",
+                self.temp_path,
+                optimize_indexes=True,
+                workers=2,
+                stdout=StringIO(),
+            )
+
+    def test_import_streams_in_batches(self):
+        """Test readings are flushed per batch and a later bad line rolls back."""
+        content = (
+            "ZHV|0000475658|D0010002|D|UDMS|X|MRCY|20160302153151||||OPER| | |\n"
+            "026|1200023305967|V| | |\n"
+            "028|F75A 00802|D| | |\n"
+            "030|S|20160222000000|56311.0|||T|N| | |\n"
+            "030|S|20160223000000|56320.0|||T|N| | |\n"
+            "026|1900001059816|V| | |\n"
+            "028|S95A 00001|C| | |\n"
+            "030|S|20160224000000|100.0|||T|N| | |\n"
+            "ZPT|0000475658|35||11|20160302154650| |"
+        )
+        path = self.write_uff(content)
+        bad_path = self.write_uff(content.replace("20160224000000", "BADDATE"))
+        with override_settings(D0010_BULK_BATCH_SIZE=1):
+            call_command("import_d0010", path, stdout=StringIO())
+            out = StringIO()
+            call_command("import_d0010", bad_path, stdout=out)
+
+        flow_file = FlowFile.objects.get()
+        self.assertEqual(flow_file.file_reference, "0000475658")
+        self.assertEqual(flow_file.record_count, 3)
+        self.assertEqual(Meter.objects.count(), 2)
+        self.assertEqual(Reading.objects.count(), 3)
+        self.assertIn("Failed to parse 030", out.getvalue())
+
+    def test_import_directory(self):
+        """Test a directory argument imports the .uff files inside it."""
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("b.uff", "a.uff"):
+                with open(os.path.join(directory, name), "w") as f:
+                    f.write(self.sample_content)
+            with open(os.path.join(directory, "notes.txt"), "w") as f:
+                f.write("not a flow file")
+
+            out = StringIO()
+            call_command("import_d0010", directory, stdout=out)
+
+        self.assertEqual(
+            list(FlowFile.objects.order_by("filename").values_list("filename")),
+            [("a.uff",), ("b.uff",)],
+        )
+        self.assertLess(out.getvalue().index("a.uff"), out.getvalue().index("b.uff"))
+
     def test_dry_run_mode(self):
         """Test dry run mode doesn't persist data."""
-        call_command("import_d0010", self.temp_file.name, dry_run=True)
+        call_command("import_d0010", self.temp_path, dry_run=True)
 
         self.assertEqual(FlowFile.objects.count(), 0)
         self.assertEqual(MeterPoint.objects.count(), 0)
@@ -58,180 +290,145 @@ class ImportD0010CommandTest(TestCase):
 
     def test_duplicate_file_import(self):
         """Test rejection of duplicate files."""
-        call_command("import_d0010", self.temp_file.name, stdout=StringIO())
+        call_command("import_d0010", self.temp_path, stdout=StringIO())
         out = StringIO()
-        call_command("import_d0010", self.temp_file.name, stdout=out)
+        call_command("import_d0010", self.temp_path, stdout=out)
         self.assertIn("already been imported", out.getvalue())
 
-    def test_invalid_mpan(self):
-        """Test invalid MPAN handling."""
-        content = """ZHD|TEST|FLOW
-026|INVALID
-028|SN123|S
-030|S|20160222000000|100.5|||T|N| | |
-ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            out = StringIO()
-            call_command("import_d0010", path, stdout=out)
-            # Error format: "Failed to parse 026 record"
-            self.assertIn("Failed to parse 026", out.getvalue())
-        finally:
-            os.unlink(path)
-
-    def test_empty_file(self):
-        """Test empty file handling."""
-        content = "ZHD|TEST|FLOW\nZPT|TEST|0"
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            out = StringIO()
-            call_command("import_d0010", path, stdout=out)
-            self.assertIn("No readings", out.getvalue())
-        finally:
-            os.unlink(path)
+    def test_duplicate_file_inside_outer_transaction(self):
+        """Test a duplicate import leaves an enclosing transaction usable."""
+        from django.db import transaction
 
-    def test_reading_without_mpan(self):
-        """Test reading without MPAN."""
-        content = """ZHD|TEST|FLOW
-030|S|20160222000000|100.5|||T|N| | |
-ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            out = StringIO()
-            call_command("import_d0010", path, stdout=out)
-            # Error format: "Failed to parse 030 record"
-            self.assertIn("Failed to parse 030", out.getvalue())
-        finally:
-            os.unlink(path)
+        from meter_readings.exceptions import DuplicateFileError
+        from meter_readings.management.commands.import_d0010 import import_file
 
-    def test_invalid_date_format(self):
-        """Test invalid date format."""
-        content = """ZHD|TEST|FLOW
-026|1234567890123
-028|SN123|S
-030|S|BADDATE|100.5|||T|N| | |
-ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            out = StringIO()
-            call_command("import_d0010", path, stdout=out)
-            # Error format: "Failed to parse 030 record" for date issues
-            self.assertIn("Failed to parse 030", out.getvalue())
-        finally:
-            os.unlink(path)
+        import_file(self.temp_path)
 
-    def test_invalid_reading_value(self):
-        """Test invalid reading value."""
-        content = """ZHD|TEST|FLOW
-026|1234567890123
-028|SN123|S
-030|S|20160222000000|INVALID|||T|N| | |
-ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            out = StringIO()
-            call_command("import_d0010", path, stdout=out)
-            # Error format: "Failed to parse 030 record" for value issues
-            self.assertIn("Failed to parse 030", out.getvalue())
-        finally:
-            os.unlink(path)
+        with transaction.atomic():
+            with self.assertRaises(DuplicateFileError):
+                import_file(self.temp_path)
+            self.assertEqual(FlowFile.objects.count(), 1)
 
-    def test_empty_serial_number(self):
-        """Test empty serial number."""
-        content = """ZHD|TEST|FLOW
-026|1234567890123
-028||S
-030|S|20160222000000|100.5|||T|N| | |
-ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            out = StringIO()
-            call_command("import_d0010", path, stdout=out)
-            # Error format: "Failed to parse 028 record" for empty serial
-            self.assertIn("Failed to parse 028", out.getvalue())
-        finally:
-            os.unlink(path)
+        self.assertEqual(Reading.objects.count(), 1)
 
-    def test_file_with_blank_lines(self):
-        """Test file with blank lines are skipped."""
-        content = """ZHD|TEST|FLOW
+    def test_invalid_records(self):
+        """Test each malformed record is reported against its record type."""
+        mpan, meter, reading = (
+            "026|1234567890123",
+            "028|SN123|S",
+            "030|S|20160222000000|100.5|||T|N| | |",
+        )
+        cases = [
+            # case, records between header and trailer, expected message
+            ("invalid MPAN", ["026|INVALID", meter, reading], "Failed to parse 026"),
+            ("no readings", [], "No readings"),
+            ("reading without MPAN", [reading], "Failed to parse 030"),
+            (
+                "invalid date",
+                [mpan, meter, reading.replace("20160222000000", "BADDATE")],
+                "Failed to parse 030",
+            ),
+            (
+                "invalid value",
+                [mpan, meter, reading.replace("100.5", "INVALID")],
+                "Failed to parse 030",
+            ),
+            ("empty serial", [mpan, "028||S", reading], "Failed to parse 028"),
+            ("short 026", ["026", meter, reading], "Failed to parse 026"),
+            ("short 028", [mpan, "028", reading], "Failed to parse 028"),
+            ("short 030", [mpan, meter, "030"], "Failed to parse 030"),
+        ]
 
-026|1234567890123
+        # Parsed in memory: the command's error reporting is covered by
+        # test_import_streams_in_batches
+        for case, records, expected in cases:
+            with self.subTest(case=case):
+                content = "\n".join(["ZHD|TEST|FLOW", *records, "ZPT|TEST|1"])
+                with self.assertRaisesMessage(D0010ImportError, expected):
+                    parse_d0010_bytes(content.encode())
 
-028|SN123|S
-030|S|20160222000000|100.5|||T|N| | |
-ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            call_command("import_d0010", path, stdout=StringIO())
-            self.assertEqual(Reading.objects.count(), 1)
-        finally:
-            os.unlink(path)
+    def test_padded_fields(self):
+        """Test blank padding inside 026 and 030 fields is stripped."""
+        file_data = parse_d0010_bytes(
+            b"ZHV|0000475656|D0010002|\n"
+            b"026|1200023305967 |V| | |\n"
+            b"028|F75A 00802|D| | |\n"
+            b"030| S | 20160222000000 | 56311.0 |||T|N| | |\n"
+            b"ZPT|0000475656|1|\n"
+        )
 
-    def test_invalid_026_record(self):
-        """Test invalid 026 MPAN record."""
-        content = """ZHD|TEST|FLOW
-026
-028|SN123|S
-030|S|20160222000000|100.5|||T|N| | |
-ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            out = StringIO()
-            call_command("import_d0010", path, stdout=out)
-            self.assertIn("Failed to parse 026", out.getvalue())
-        finally:
-            os.unlink(path)
+        (reading,) = file_data["readings"]
+        self.assertEqual(reading.mpan, "1200023305967")
+        self.assertEqual(reading.register_id, "S")
+        self.assertEqual(reading.reading_date.day, 22)
+        self.assertEqual(str(reading.reading_value), "56311.0")
 
-    def test_invalid_028_record(self):
-        """Test invalid 028 meter record."""
-        content = """ZHD|TEST|FLOW
-026|1234567890123
-028
-030|S|20160222000000|100.5|||T|N| | |
-ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            out = StringIO()
-            call_command("import_d0010", path, stdout=out)
-            self.assertIn("Failed to parse 028", out.getvalue())
-        finally:
-            os.unlink(path)
+    def test_reading_date_parsing(self):
+        """Test reading timestamps are parsed as Europe/London local time."""
+        from datetime import datetime, timedelta
+
+        from meter_readings.management.commands.import_d0010 import (
+            parse_reading_record,
+        )
+
+        reading = parse_reading_record(
+            ["030", "S", "20160622093015", "1.0"], "1234567890123", "SN1", "S"
+        )
+        self.assertEqual(
+            reading.reading_date.replace(tzinfo=None),
+            datetime(2016, 6, 22, 9, 30, 15),
+        )
+        self.assertEqual(reading.reading_date.utcoffset(), timedelta(hours=1))
+
+        # Clocks go back at 02:00 BST: the repeated hour is read as GMT,
+        # and the skipped hour in spring likewise takes the GMT offset
+        for clock_change in ("20161030013000", "20160327013000"):
+            with self.subTest(clock_change=clock_change):
+                reading = parse_reading_record(
+                    ["030", "S", clock_change, "1.0"], "1234567890123", "SN1", "S"
+                )
+                self.assertEqual(reading.reading_date.utcoffset(), timedelta(0))
 
-    def test_invalid_030_record(self):
-        """Test invalid 030 reading record."""
+        for bad_date in ("20161340000000", "2016022200000x", "+2016022200000"):
+            with self.subTest(bad_date=bad_date):
+                with self.assertRaises(ValueError):
+                    parse_reading_record(
+                        ["030", "S", bad_date, "1.0"], "1234567890123", "SN1", "S"
+                    )
+
+    def test_reading_value_must_fit_column(self):
+        """Test negative, non-finite and oversized values are parse errors."""
+        from meter_readings.management.commands.import_d0010 import (
+            parse_reading_record,
+        )
+
+        reading = parse_reading_record(
+            ["030", "S", "20160222000000", "999999999.999"], "1234567890123", "SN1", "S"
+        )
+        self.assertEqual(str(reading.reading_value), "999999999.999")
+
+        for bad_value in ("NaN", "Infinity", "-inf", "-0.5", "1000000000"):
+            with self.subTest(bad_value=bad_value):
+                with self.assertRaises(ValueError):
+                    parse_reading_record(
+                        ["030", "S", "20160222000000", bad_value],
+                        "1234567890123",
+                        "SN1",
+                        "S",
+                    )
+
+    def test_file_with_blank_lines(self):
+        """Test file with blank lines are skipped."""
         content = """ZHD|TEST|FLOW
+
 026|1234567890123
+
 028|SN123|S
-030
+030|S|20160222000000|100.5|||T|N| | |
 ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            out = StringIO()
-            call_command("import_d0010", path, stdout=out)
-            self.assertIn("Failed to parse 030", out.getvalue())
-        finally:
-            os.unlink(path)
+        path = self.write_uff(content)
+        call_command("import_d0010", path, stdout=StringIO())
+        self.assertEqual(Reading.objects.count(), 1)
 
     def test_database_error_handling(self):
         """Test database error handling during save."""
@@ -242,16 +439,11 @@ ZPT|TEST|1"""
 028|SN123|S
 030|S|20160222000000|100.5|||T|N| | |
 ZPT|TEST|1"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".uff", delete=False) as f:
-            f.write(content)
-            path = f.name
-        try:
-            with patch(
-                "meter_readings.models.Reading.objects.get_or_create",
-                side_effect=Exception("DB Error"),
-            ):
-                out = StringIO()
-                call_command("import_d0010", path, stdout=out)
-                self.assertIn("Database error", out.getvalue())
-        finally:
-            os.unlink(path)
+        path = self.write_uff(content)
+        with patch(
+            "meter_readings.models.Reading.objects.bulk_create",
+            side_effect=Exception("DB Error"),
+        ):
+            out = StringIO()
+            call_command("import_d0010", path, stdout=out)
+            self.assertIn("Database error", out.getvalue())
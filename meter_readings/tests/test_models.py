@@ -21,6 +21,12 @@ class MeterPointModelTest(TestCase):
             mp = MeterPoint(mpan="12345")
             mp.full_clean()
 
+    def test_mpan_rejects_non_ascii_digits(self):
+        """Test MPAN validation rejects Unicode digits str.isdigit accepts."""
+        with self.assertRaises(ValidationError) as ctx:
+            MeterPoint(mpan="١٢٣٤٥٦٧٨٩٠١٢٣").full_clean()
+        self.assertEqual(ctx.exception.error_dict["mpan"][0].code, "invalid_mpan")
+
     def test_mpan_uniqueness(self):
         """Test MPAN uniqueness constraint."""
         MeterPoint.objects.create(mpan="1234567890123")
@@ -29,8 +35,9 @@ class MeterPointModelTest(TestCase):
 
 
 class MeterModelTest(TestCase):
-    def setUp(self):
-        self.meter_point = MeterPoint.objects.create(mpan="1234567890123")
+    @classmethod
+    def setUpTestData(cls):
+        cls.meter_point = MeterPoint.objects.create(mpan="1234567890123")
 
     def test_valid_meter_creation(self):
         """Test creating a meter with valid serial number and type."""
@@ -42,12 +49,14 @@ class MeterModelTest(TestCase):
 
 
 class ReadingModelTest(TestCase):
-    def setUp(self):
-        self.meter_point = MeterPoint.objects.create(mpan="1234567890123")
-        self.meter = Meter.objects.create(
-            meter_point=self.meter_point, serial_number="ABC123456"
+    @classmethod
+    def setUpTestData(cls):
+        # Django copies these per test, so tests may modify them freely
+        cls.meter_point = MeterPoint.objects.create(mpan="1234567890123")
+        cls.meter = Meter.objects.create(
+            meter_point=cls.meter_point, serial_number="ABC123456"
         )
-        self.flow_file = FlowFile.objects.create(
+        cls.flow_file = FlowFile.objects.create(
             filename="test.uff", file_reference="TEST001"
         )
 
@@ -64,6 +73,57 @@ class ReadingModelTest(TestCase):
         self.assertEqual(reading.mpan, "1234567890123")
         self.assertEqual(reading.meter_serial, "ABC123456")
 
+    def test_reading_copies_follow_meter_edits(self):
+        """Test editing an MPAN or serial updates the copies on readings."""
+        reading = Reading.objects.create(
+            meter=self.meter,
+            flow_file=self.flow_file,
+            register_id="S",
+            reading_date=timezone.now(),
+            reading_value=Decimal("1.0"),
+        )
+        self.meter_point.mpan = "9999999999999"
+        self.meter_point.save()
+        self.meter.serial_number = "NEW123"
+        self.meter.save()
+
+        reading.refresh_from_db()
+        self.assertEqual(reading.mpan, "9999999999999")
+        self.assertEqual(reading.meter_serial, "NEW123")
+
+    def test_reading_copies_follow_meter_reassignment(self):
+        """Test pointing a reading at another meter updates its copies."""
+        reading = Reading.objects.create(
+            meter=self.meter,
+            flow_file=self.flow_file,
+            register_id="S",
+            reading_date=timezone.now(),
+            reading_value=Decimal("1.0"),
+        )
+        other_point = MeterPoint.objects.create(mpan="1111111111111")
+        reading.meter = Meter.objects.create(meter_point=other_point, serial_number="A")
+        reading.save()
+
+        reading.refresh_from_db()
+        self.assertEqual(reading.mpan, "1111111111111")
+        self.assertEqual(reading.meter_serial, "A")
+
+    def test_reading_copies_follow_meter_move(self):
+        """Test moving a meter to another meter point updates its readings."""
+        reading = Reading.objects.create(
+            meter=self.meter,
+            flow_file=self.flow_file,
+            register_id="S",
+            reading_date=timezone.now(),
+            reading_value=Decimal("1.0"),
+        )
+        self.meter.meter_point = MeterPoint.objects.create(mpan="2222222222222")
+        self.meter.save()
+
+        reading.refresh_from_db()
+        self.assertEqual(reading.mpan, "2222222222222")
+        self.assertEqual(reading.meter_serial, "ABC123456")
+
     def test_negative_reading_validation(self):
         """Test that negative reading values are rejected."""
         with self.assertRaises(ValidationError):
@@ -76,6 +136,19 @@ class ReadingModelTest(TestCase):
             )
             reading.full_clean()
 
+    def test_reading_value_must_fit_column(self):
+        """Test values too large for the column fail validation, not the insert."""
+        reading = Reading(
+            meter=self.meter,
+            flow_file=self.flow_file,
+            register_id="S",
+            reading_date=timezone.now(),
+            reading_value=Decimal("1000000000"),
+        )
+        with self.assertRaises(ValidationError) as ctx:
+            reading.full_clean()
+        self.assertIn("reading_value", ctx.exception.message_dict)
+
     def test_flow_file_str(self):
         """Test FlowFile string representation."""
         str_repr = str(self.flow_file)
@@ -2,8 +2,11 @@
 Tests for utility functions.
 """
 
+from pathlib import Path
+from unittest import skipUnless
+
+from django.db import connection
 from django.test import TestCase
-from unittest.mock import patch, MagicMock
 
 from meter_readings.utils import get_sample_files, get_sample_file_path, clear_all_data
 
@@ -11,14 +14,10 @@ from meter_readings.utils import get_sample_files, get_sample_file_path, clear_a
 class GetSampleFilesTest(TestCase):
     """Tests for get_sample_files function."""
 
-    @patch("meter_readings.utils.Path")
-    def test_returns_empty_when_directory_missing(self, mock_path: MagicMock) -> None:
-        """Test returns empty list when sample_data directory doesn't exist."""
-        mock_sample_dir = MagicMock()
-        mock_sample_dir.exists.return_value = False
-        mock_path.return_value.__truediv__.return_value = mock_sample_dir
-
-        result = get_sample_files()
+    def test_returns_empty_when_directory_missing(self) -> None:
+        """Test returns empty list when the sample directory doesn't exist."""
+        with self.settings(SAMPLE_DATA_DIR=Path("/nonexistent/sample_data")):
+            result = get_sample_files()
 
         self.assertEqual(result, [])
 
@@ -43,9 +42,10 @@ class GetSampleFilePathTest(TestCase):
 
     def test_returns_path_to_sample_file(self) -> None:
         """Test returns correct path for a sample file."""
-        result = get_sample_file_path("test.uff")
+        with self.settings(SAMPLE_DATA_DIR=Path("/srv/sample_data")):
+            result = get_sample_file_path("test.uff")
 
-        self.assertTrue(str(result).endswith("sample_data/test.uff"))
+        self.assertEqual(result, Path("/srv/sample_data/test.uff"))
 
 
 class ClearAllDataTest(TestCase):
@@ -97,3 +97,23 @@ class ClearAllDataTest(TestCase):
         self.assertEqual(MeterPoint.objects.count(), 0)
         self.assertEqual(Meter.objects.count(), 0)
         self.assertEqual(Reading.objects.count(), 0)
+
+    @skipUnless(connection.vendor == "postgresql", "TRUNCATE is PostgreSQL only")
+    def test_clear_keeps_primary_key_sequences(self) -> None:
+        """Test ids are not reused after a clear, so old URLs stay dead."""
+        from meter_readings.models import FlowFile, MeterPoint
+
+        flow_file = FlowFile.objects.create(filename="before.uff")
+        meter_point = MeterPoint.objects.create(mpan="1234567890123")
+
+        counts = clear_all_data()
+
+        self.assertEqual(counts["flow_files"], 1)
+        self.assertEqual(counts["meter_points"], 1)
+        self.assertFalse(FlowFile.objects.exists())
+        self.assertGreater(
+            FlowFile.objects.create(filename="after.uff").pk, flow_file.pk
+        )
+        self.assertGreater(
+            MeterPoint.objects.create(mpan="1234567890123").pk, meter_point.pk
+        )
@@ -1,35 +1,52 @@
 """Tests for dashboard views."""
 
-from django.test import TestCase, Client
+from django.core.cache import cache
+from django.test import TestCase
 from meter_readings.models import FlowFile, MeterPoint, Meter, Reading
+from meter_readings.utils import bump_readings_cache_version
 from django.utils import timezone
 
 
 class ViewsTest(TestCase):
     """Test dashboard views."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.client = Client()
-
-        # Create test data
-        self.flow_file = FlowFile.objects.create(filename="test.uff")
-        self.meter_point = MeterPoint.objects.create(mpan="1234567890123")
-        self.meter = Meter.objects.create(
-            meter_point=self.meter_point, serial_number="SN123", meter_type="S"
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for the class."""
+        cls.flow_file = FlowFile.objects.create(filename="test.uff")
+        cls.meter_point = MeterPoint.objects.create(mpan="1234567890123")
+        cls.meter = Meter.objects.create(
+            meter_point=cls.meter_point, serial_number="SN123", meter_type="S"
         )
-        self.reading = Reading.objects.create(
-            meter=self.meter,
+        cls.reading = Reading.objects.create(
+            meter=cls.meter,
             reading_value=100.5,
             reading_date=timezone.now(),
             reading_type="N",
-            flow_file=self.flow_file,
+            flow_file=cls.flow_file,
         )
 
+    def setUp(self):
+        cache.clear()
+
     def test_index_view(self):
-        """Test index view renders with correct counts."""
-        response = self.client.get("/", follow=True)
+        """Test index view renders with correct counts in a single query."""
+        with self.assertNumQueries(1):
+            response = self.client.get("/", follow=True)
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "Kraken Energy D0010 System")
         self.assertContains(response, "1")  # Check counts appear
+
+    def test_index_view_cached_until_version_bump(self):
+        """Test index page is served from cache until the data changes."""
+        self.client.get("/")
+
+        with self.assertNumQueries(0):
+            response = self.client.get("/")
+        self.assertContains(response, "Kraken Energy D0010 System")
+
+        bump_readings_cache_version()
+
+        with self.assertNumQueries(1):
+            self.client.get("/")
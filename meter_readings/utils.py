@@ -2,25 +2,43 @@
 Utility functions for meter_readings app.
 """
 
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Type
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Model
+
+# Folded into the cache_page key prefix of read-only reading views; bumping
+# it orphans every cached page at once after the data changes.
+READINGS_CACHE_VERSION_KEY = "readings:cache_version"
 
 
 def get_sample_files() -> List[str]:
-    """Get list of all .uff files in sample_data directory."""
-    sample_dir = Path(settings.BASE_DIR) / "sample_data"
+    """Get list of all .uff files in the sample data directory."""
+    sample_dir = Path(settings.SAMPLE_DATA_DIR)
     if not sample_dir.exists():
         return []
 
-    files = list(sample_dir.glob("*.uff"))
-    return sorted([f.name for f in files])
+    return sorted(f.name for f in sample_dir.glob("*.uff"))
 
 
 def get_sample_file_path(filename: str) -> Path:
     """Get full path to a sample file."""
-    return Path(settings.BASE_DIR) / "sample_data" / filename
+    return Path(settings.SAMPLE_DATA_DIR) / filename
+
+
+def count_rows(*models: Type[Model]) -> List[int]:
+    """Count the rows of several tables in a single query."""
+    quote_name = connection.ops.quote_name
+    subqueries = ", ".join(
+        f"(SELECT COUNT(*) FROM {quote_name(model._meta.db_table)})" for model in models
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {subqueries}")
+        return list(cursor.fetchone())
 
 
 def clear_all_data() -> Dict[str, int]:
@@ -30,17 +48,45 @@ def clear_all_data() -> Dict[str, int]:
     """
     from .models import Reading, Meter, MeterPoint, FlowFile
 
-    count = {
-        "readings": Reading.objects.count(),
-        "meters": Meter.objects.count(),
-        "meter_points": MeterPoint.objects.count(),
-        "flow_files": FlowFile.objects.count(),
+    # Children first, so the deletes respect foreign keys
+    models = (Reading, Meter, MeterPoint, FlowFile)
+
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            # TRUNCATE reports no row counts, so count first; it then empties
+            # every table in one statement with no per-row cascade collection.
+            # Sequences carry on, so ids are never reused after a clear.
+            readings, meters, meter_points, flow_files = count_rows(*models)
+            tables = ", ".join(
+                connection.ops.quote_name(model._meta.db_table) for model in models
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f"TRUNCATE {tables} CASCADE")
+        else:
+            # Plain DELETE per table (no signals, no collecting PKs in
+            # Python); its row count doubles as the count to report
+            readings, meters, meter_points, flow_files = (
+                model._base_manager.all()._raw_delete(connection.alias)
+                for model in models
+            )
+
+    return {
+        "readings": readings,
+        "meters": meters,
+        "meter_points": meter_points,
+        "flow_files": flow_files,
     }
 
-    # Delete in correct order (respect foreign keys)
-    Reading.objects.all().delete()
-    Meter.objects.all().delete()
-    MeterPoint.objects.all().delete()
-    FlowFile.objects.all().delete()
 
-    return count
+def get_readings_cache_version() -> int:
+    """Return the current version of cached reading responses."""
+    return cache.get_or_set(READINGS_CACHE_VERSION_KEY, lambda: int(time.time()), None)
+
+
+def bump_readings_cache_version() -> None:
+    """Invalidate all cached reading responses."""
+    try:
+        cache.incr(READINGS_CACHE_VERSION_KEY)
+    except ValueError:
+        # Key evicted; restart from a value older pages cannot have used
+        cache.set(READINGS_CACHE_VERSION_KEY, int(time.time()), None)
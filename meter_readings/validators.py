@@ -0,0 +1,41 @@
+"""
+Validation rules shared by the models and the D0010 importer.
+
+The importer calls the is_valid_* predicates directly on every row, so bulk
+imports never go through full_clean(); the validate_* wrappers are the
+same rules as model field validators.
+"""
+
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+
+# Reading.reading_value is numeric(12, 3): at most 9 integer digits
+MAX_READING_VALUE = Decimal(10) ** 9
+
+
+def is_valid_mpan(value: str) -> bool:
+    """Return True for a 13-digit ASCII MPAN, without a regex."""
+    return len(value) == 13 and value.isascii() and value.isdigit()
+
+
+def validate_mpan(value: str) -> None:
+    """Field validator for MeterPoint.mpan."""
+    if not is_valid_mpan(value):
+        raise ValidationError("MPAN must be exactly 13 digits", code="invalid_mpan")
+
+
+def is_valid_reading_value(value: Decimal) -> bool:
+    """Return True for a finite, non-negative value that fits the column."""
+    return value.is_finite() and 0 <= value < MAX_READING_VALUE
+
+
+def validate_reading_value(value: Decimal) -> None:
+    """Field validator for Reading.reading_value."""
+    if not is_valid_reading_value(value):
+        message = (
+            "Reading value cannot be negative"
+            if value.is_finite() and value < 0
+            else f"Reading value must be less than {MAX_READING_VALUE}"
+        )
+        raise ValidationError(message, code="invalid_reading_value")